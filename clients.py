@@ -0,0 +1,73 @@
+"""
+Process-wide Horizon and Soroban RPC clients.
+
+Every module that talks to the network gets its client from here, so the
+process keeps a single keep-alive connection pool and SSL context per
+endpoint no matter how many entry points (server, test harnesses) import it.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from stellar_sdk import ServerAsync
+from stellar_sdk.soroban_server_async import SorobanServerAsync
+
+from stellar_ssl import StellarAiohttpClient, StellarHttpxClient, create_soroban_client_with_ssl
+
+
+@lru_cache(maxsize=None)
+def horizon(horizon_url: str, pool_size: Optional[int] = None, http2: bool = False) -> ServerAsync:
+    """
+    Return the shared Horizon client for horizon_url (created on first call)
+
+    Args:
+        horizon_url: Horizon server URL
+        pool_size: Keep-alive connection pool size (None for unlimited)
+        http2: Multiplex requests over HTTP/2 (needs httpx[http2]; falls back
+               to HTTP/1.1 with a warning when it is not installed)
+
+    Returns:
+        ServerAsync backed by an SSL-configured HTTP client (orjson decoding)
+    """
+    if http2:
+        try:
+            client = StellarHttpxClient(pool_size=pool_size, fast_json=True)
+            return ServerAsync(horizon_url=horizon_url, client=client)
+        except ImportError as e:
+            print(f"Warning: HTTP/2 unavailable ({e}); using HTTP/1.1")
+    return ServerAsync(
+        horizon_url=horizon_url,
+        client=StellarAiohttpClient(pool_size=pool_size, fast_json=True)
+    )
+
+
+@lru_cache(maxsize=None)
+def horizon_stream(horizon_url: str) -> ServerAsync:
+    """
+    Return the shared Horizon client used for SSE streams on horizon_url
+
+    Streams always go over aiohttp (the SDK's SSE client is aiohttp-based),
+    independent of the HTTP2 setting of the request client.
+
+    Args:
+        horizon_url: Horizon server URL
+
+    Returns:
+        ServerAsync backed by an SSL-configured aiohttp client
+    """
+    return ServerAsync(horizon_url=horizon_url, client=StellarAiohttpClient())
+
+
+@lru_cache(maxsize=None)
+def soroban(server_url: str, pool_size: Optional[int] = None) -> SorobanServerAsync:
+    """
+    Return the shared Soroban RPC client for server_url (created on first call)
+
+    Args:
+        server_url: Soroban RPC server URL
+        pool_size: Keep-alive connection pool size (None for unlimited)
+
+    Returns:
+        SorobanServerAsync backed by an SSL-configured aiohttp client
+    """
+    return create_soroban_client_with_ssl(server_url, pool_size=pool_size)
@@ -0,0 +1,43 @@
+"""
+Server configuration, read from the environment (and .env) once at import.
+"""
+
+import os
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable snapshot of the server's environment configuration"""
+
+    horizon_url: str
+    soroban_rpc_url: str
+    stellar_network: str
+    http_pool_size: int
+    http2: bool
+    key_store_max: int
+    key_store_eviction: str
+    key_store_ttl: float
+    warm_sequences: bool
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Load .env (if present) and build a Config from the environment"""
+        load_dotenv()
+        return cls(
+            horizon_url=os.getenv("HORIZON_URL", "https://horizon-testnet.stellar.org"),
+            soroban_rpc_url=os.getenv("SOROBAN_RPC_URL", "https://soroban-testnet.stellar.org"),
+            stellar_network=os.getenv("STELLAR_NETWORK", "testnet"),
+            http_pool_size=int(os.getenv("HTTP_POOL_SIZE", "32")),
+            http2=os.getenv("HTTP2", "false").lower() in ("1", "true", "yes"),
+            key_store_max=int(os.getenv("KEY_STORE_MAX", "10000")),
+            key_store_eviction=os.getenv("KEY_STORE_EVICTION", "lru"),
+            key_store_ttl=float(os.getenv("KEY_STORE_TTL", "0")),
+            warm_sequences=os.getenv("WARM_SEQUENCES", "false").lower() in ("1", "true", "yes"),
+        )
+
+
+# Shared by every importer; .env is located and parsed only once per process
+CONFIG = Config.from_env()
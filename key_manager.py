@@ -5,45 +5,364 @@ For production: consider hardware security modules (HSM) or key management servi
 """
 
 from stellar_sdk import Keypair
+from collections import OrderedDict
+from typing import Optional
 import json
 import os
 from pathlib import Path
+import random
+import threading
+import time
+
+from config import CONFIG
+
+# Saturation bound for counter-based eviction (uint16); all counters are
+# halved when any entry reaches it
+_COUNTER_MAX = 0xFFFF
+
+# Active expiry sweep: every interval, sample this many expiring keys and
+# delete the expired ones; sample again right away while more than the
+# given fraction of a sample was expired
+_SWEEP_INTERVAL = 0.1
+_SWEEP_SAMPLE = 20
+_SWEEP_REPEAT_RATIO = 0.2
+
+
+def _write_json_atomic(path: Path, data: dict):
+    """Write data as JSON to path via a 0600 temp file and an atomic rename"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    # Create with restrictive permissions (owner read/write only) up front
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 class KeyManager:
     """Manages Stellar keypairs securely server-side with file persistence"""
 
-    def __init__(self, keystore_path: str = ".stellar_keystore.json"):
+    def __init__(
+        self,
+        keystore_path: str = ".stellar_keystore.json",
+        max_keys: Optional[int] = None,
+        eviction: Optional[str] = None,
+        key_ttl: Optional[float] = None
+    ):
         """
         Initialize KeyManager with file-based persistence
 
+        The keystore file always holds every stored key. In memory only
+        `max_keys` keypairs are kept; evicted accounts are transparently
+        reloaded from the file on next use.
+
+        Eviction policies:
+            lru - Evict the least recently used keypair (reorders on every hit)
+            counter - Evict the least frequently used keypair; hits only bump a
+                      per-entry counter, so reads never reorder the store
+
+        With a key TTL, accounts generated via store() (e.g. ephemeral testnet
+        accounts) are deleted from memory and the keystore file once expired:
+        lazily on access, plus a background sweep. Imported keys never expire.
+        Expiry deadlines are persisted (as wall-clock times) in a sidecar file
+        next to the keystore, so they survive restarts; keys that expired while
+        the process was down are deleted on load.
+
         Args:
             keystore_path: Path to keystore file (default: .stellar_keystore.json)
+            max_keys: Max keypairs held in memory (default: CONFIG.key_store_max)
+            eviction: "lru" or "counter" (default: CONFIG.key_store_eviction)
+            key_ttl: Seconds before a stored key expires (default: CONFIG.key_store_ttl;
+                     0 = never)
         """
         self.keystore_path = Path(keystore_path)
-        self._keypair_store = {}
+        # Sidecar holding account_id -> expiry (Unix time) for keys with a TTL
+        self._expiry_path = self.keystore_path.with_suffix(".expiry.json")
+        self._max_keys = max_keys if max_keys is not None else CONFIG.key_store_max
+        self._eviction = eviction or CONFIG.key_store_eviction
+        if self._eviction not in ("lru", "counter"):
+            raise ValueError(f"Unknown eviction policy: {self._eviction}")
+        # account_id -> [secret_key, Keypair, access_counter, raw_seed]. The
+        # Keypair (and its 32-byte Ed25519 seed) is derived once so signing
+        # paths never repeat the StrKey decode / Ed25519 key setup.
+        # Under "lru" the order is least recently used first.
+        self._keypair_store = OrderedDict()
+        # True while every key in the keystore file is also held in memory,
+        # which lets lookups and listings skip the file entirely
+        self._complete = True
+        if key_ttl is None:
+            key_ttl = CONFIG.key_store_ttl
+        self._ttl_ns = int(key_ttl * 1e9) if key_ttl > 0 else None
+        # account_id -> expiry (time.monotonic_ns) for keys stored with a TTL.
+        # Kept apart from the bounded cache so eviction never forgets an expiry.
+        self._expiry = {}
+        # Guards the store against the background sweeper thread
+        self._lock = threading.RLock()
+        # list_accounts() result, reset whenever an account is added or removed
+        self._list_cache: Optional[list] = None
+        # (mtime_ns, size, secrets) of the keystore file as last read or written
+        self._disk_snapshot: Optional[tuple] = None
         self._load_from_file()
+        self._load_expiry()
+        if self._expiry:
+            self._purge_expired()
+
+        self._stop_sweeper = threading.Event()
+        # Sweep restored deadlines too, even if the TTL has since been disabled
+        if self._ttl_ns is not None or self._expiry:
+            threading.Thread(target=self._sweep_loop, name="keystore-ttl-sweeper", daemon=True).start()
+
+    def _read_keystore(self, strict: bool = False) -> dict:
+        """
+        Read the raw account_id -> secret_key mapping from disk
+
+        Memoized on the file's mtime and size, so misses on evicted or unknown
+        accounts don't re-parse an unchanged keystore. Callers must not mutate
+        the result.
+
+        Args:
+            strict: Raise when an existing keystore cannot be read, instead of
+                    warning and treating it as empty
+
+        Raises:
+            OSError, json.JSONDecodeError: If strict and the file is unreadable
+        """
+        try:
+            stat = self.keystore_path.stat()
+        except FileNotFoundError:
+            return {}
+        snapshot = self._disk_snapshot
+        if snapshot is not None and snapshot[:2] == (stat.st_mtime_ns, stat.st_size):
+            return snapshot[2]
+        try:
+            with open(self.keystore_path, 'r') as f:
+                secrets = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            if strict:
+                raise
+            print(f"Warning: Could not load keystore from {self.keystore_path}: {e}")
+            return {}
+        self._disk_snapshot = (stat.st_mtime_ns, stat.st_size, secrets)
+        return secrets
 
     def _load_from_file(self):
         """Load keypairs from persistent storage"""
-        if self.keystore_path.exists():
+        try:
+            secrets = self._read_keystore(strict=True)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load keystore from {self.keystore_path}: {e}")
+            # Saves merge with (and so refuse to overwrite) a file they can't read
+            self._complete = False
+            return
+        if len(secrets) > self._max_keys:
+            self._complete = False
+
+        # Entries are kept in file order, so the tail is the most recently stored
+        # (guard 0: a [-0:] slice would be the whole file)
+        newest = list(secrets.items())[-self._max_keys:] if self._max_keys else []
+        for account_id, secret_key in newest:
             try:
-                with open(self.keystore_path, 'r') as f:
-                    self._keypair_store = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load keystore from {self.keystore_path}: {e}")
-                self._keypair_store = {}
-
-    def _save_to_file(self):
-        """Save keypairs to persistent storage"""
+                self._keypair_store[account_id] = self._make_entry(secret_key, Keypair.from_secret(secret_key))
+            except ValueError as e:
+                print(f"Warning: Skipping invalid keystore entry {account_id}: {e}")
+                # Memory no longer mirrors the file: saves must merge with it
+                # so the unreadable entry is preserved, not overwritten
+                self._complete = False
+
+    def _load_expiry(self):
+        """Restore expiry deadlines from the sidecar file"""
+        try:
+            with open(self._expiry_path, 'r') as f:
+                deadlines = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load key expiry from {self._expiry_path}: {e}")
+            return
+        # Convert wall-clock deadlines back onto this process's monotonic clock
+        now, now_ns = time.time(), time.monotonic_ns()
+        for account_id, expires_at in deadlines.items():
+            self._expiry[account_id] = now_ns + int((expires_at - now) * 1e9)
+
+    def _save_expiry(self, removed: frozenset = frozenset()):
+        """Persist expiry deadlines (except `removed`) as wall-clock times to the sidecar file"""
+        if not self._expiry and not self._expiry_path.exists():
+            return
+        now, now_ns = time.time(), time.monotonic_ns()
+        deadlines = {
+            account_id: now + (expires - now_ns) / 1e9
+            for account_id, expires in self._expiry.items()
+            if account_id not in removed
+        }
+        try:
+            _write_json_atomic(self._expiry_path, deadlines)
+        except IOError as e:
+            print(f"Warning: Could not save key expiry to {self._expiry_path}: {e}")
+
+    def _save_to_file(self, removed: frozenset = frozenset(), added: Optional[dict] = None):
+        """
+        Save keypairs to persistent storage, dropping any `removed` accounts
+
+        Args:
+            removed: Account ids to delete from the file
+            added: account_id -> secret_key entries to write even if not cached
+
+        Raises:
+            OSError, json.JSONDecodeError: If the existing keystore can't be read
+                to merge with; the file is then left untouched
+        """
+        # Merge with the file so keypairs evicted from memory are never dropped
+        # and existing entries keep their (insertion) order
+        secrets = dict(self._read_keystore(strict=True))
+        for account_id in removed:
+            secrets.pop(account_id, None)
+        for account_id, entry in self._keypair_store.items():
+            if account_id not in removed:
+                secrets[account_id] = entry[0]
+        if added:
+            secrets.update(added)
         try:
-            # Write with restrictive permissions (owner read/write only)
-            with open(self.keystore_path, 'w') as f:
-                json.dump(self._keypair_store, f, indent=2)
-            # Set file permissions to 600 (owner read/write only)
-            os.chmod(self.keystore_path, 0o600)
+            _write_json_atomic(self.keystore_path, secrets)
+            stat = self.keystore_path.stat()
+            self._disk_snapshot = (stat.st_mtime_ns, stat.st_size, secrets)
         except IOError as e:
             print(f"Warning: Could not save keystore to {self.keystore_path}: {e}")
+        self._save_expiry(removed)
+
+    @staticmethod
+    def _make_entry(secret_key: str, keypair: Keypair) -> list:
+        """Build a store entry: [secret_key, Keypair, access_counter, raw_seed]"""
+        return [secret_key, keypair, 1, keypair.raw_secret_key()]
+
+    def _cache(self, account_id: str, secret_key: str, keypair: Keypair) -> list:
+        """Insert an entry, evicting one first when the store is full"""
+        if not self._max_keys:
+            # Caching disabled: hand the entry back without holding it
+            self._complete = False
+            return self._make_entry(secret_key, keypair)
+        if account_id not in self._keypair_store and len(self._keypair_store) >= self._max_keys:
+            self._evict()
+        entry = self._make_entry(secret_key, keypair)
+        self._keypair_store[account_id] = entry
+        if self._eviction == "lru":
+            self._keypair_store.move_to_end(account_id)
+        return entry
+
+    def _evict(self):
+        """Drop one keypair from memory according to the eviction policy"""
+        if not self._keypair_store:
+            return
+        if self._eviction == "lru":
+            self._keypair_store.popitem(last=False)
+        else:
+            victim = min(self._keypair_store, key=lambda account_id: self._keypair_store[account_id][2])
+            del self._keypair_store[victim]
+        self._complete = False
+
+    def _touch(self, account_id: str, entry: list):
+        """Record a hit on entry for the eviction policy"""
+        if self._eviction == "lru":
+            self._keypair_store.move_to_end(account_id)
+            return
+        entry[2] += 1
+        if entry[2] >= _COUNTER_MAX:
+            # Age every counter so they stay bounded and recent use still wins
+            for other in self._keypair_store.values():
+                other[2] >>= 1
+
+    def _delete(self, account_ids: list):
+        """Remove accounts from the keystore file, then from memory"""
+        # Save first: if the keystore can't be read, nothing is forgotten
+        self._save_to_file(removed=frozenset(account_ids))
+        for account_id in account_ids:
+            self._keypair_store.pop(account_id, None)
+            self._expiry.pop(account_id, None)
+        self._list_cache = None
+
+    def _save_new(self, account_id: str, secret_key: str):
+        """Persist a just-cached key; if that fails, forget it again and re-raise"""
+        try:
+            self._save_to_file(added={account_id: secret_key})
+        except (json.JSONDecodeError, IOError):
+            # Never hold (and sign with) a key that would be lost on restart
+            self._keypair_store.pop(account_id, None)
+            self._expiry.pop(account_id, None)
+            self._complete = False
+            raise
+
+    def _purge_expired(self):
+        """Delete every expired key (used before listing accounts)"""
+        now = time.monotonic_ns()
+        expired = [account_id for account_id, expires in self._expiry.items() if expires <= now]
+        if expired:
+            self._delete(expired)
+
+    def _sweep_loop(self):
+        """Background sampler that deletes expired keys every _SWEEP_INTERVAL"""
+        while not self._stop_sweeper.wait(_SWEEP_INTERVAL):
+            with self._lock:
+                while self._expiry:
+                    sample = random.sample(list(self._expiry), min(_SWEEP_SAMPLE, len(self._expiry)))
+                    now = time.monotonic_ns()
+                    expired = [account_id for account_id in sample if self._expiry[account_id] <= now]
+                    if expired:
+                        try:
+                            self._delete(expired)
+                        except (json.JSONDecodeError, IOError) as e:
+                            # Keystore unreadable: retry on the next sweep
+                            print(f"Warning: Could not delete expired keys: {e}")
+                            break
+                    if len(expired) <= len(sample) * _SWEEP_REPEAT_RATIO:
+                        break
+
+    def close(self):
+        """Stop the background expiry sweeper (if running)"""
+        self._stop_sweeper.set()
+
+    def _lookup(self, account_id: str) -> Optional[list]:
+        """Return the [secret_key, Keypair, counter, raw_seed] entry for account_id, or None"""
+        if self._expiry:
+            expires = self._expiry.get(account_id)
+            if expires is not None and expires <= time.monotonic_ns():
+                self._delete([account_id])
+                return None
+        try:
+            entry = self._keypair_store[account_id]
+        except KeyError:
+            pass
+        else:
+            self._touch(account_id, entry)
+            return entry
+        if self._complete:
+            return None
+
+        # Evicted from memory: reload from the keystore file
+        secret_key = self._read_keystore().get(account_id)
+        if secret_key is None:
+            return None
+        try:
+            keypair = Keypair.from_secret(secret_key)
+        except ValueError:
+            # Invalid entry (skipped at load): kept on disk, unusable here
+            return None
+        return self._cache(account_id, secret_key, keypair)
+
+    def _raw_seed(self, account_id: str) -> bytes:
+        """
+        Return the raw 32-byte Ed25519 seed for account_id
+
+        Lets bulk-signing paths build a signing key (e.g. nacl.signing.SigningKey)
+        directly without going back through StrKey decoding.
+
+        Raises:
+            ValueError: If account_id not found in storage
+        """
+        with self._lock:
+            entry = self._lookup(account_id)
+        if entry is None:
+            raise ValueError(f"Account {account_id} not found in storage")
+        return entry[3]
 
     def store(self, account_id: str, secret_key: str):
         """
@@ -53,8 +372,13 @@ class KeyManager:
             account_id: Stellar public key (G...)
             secret_key: Stellar secret key (S...)
         """
-        self._keypair_store[account_id] = secret_key
-        self._save_to_file()
+        keypair = Keypair.from_secret(secret_key)
+        with self._lock:
+            self._cache(account_id, secret_key, keypair)
+            if self._ttl_ns is not None:
+                self._expiry[account_id] = time.monotonic_ns() + self._ttl_ns
+            self._list_cache = None
+            self._save_new(account_id, secret_key)
 
     def get_keypair(self, account_id: str) -> Keypair:
         """
@@ -64,27 +388,65 @@ class KeyManager:
             account_id: Stellar public key (G...)
 
         Returns:
-            Keypair object for signing
+            Keypair object for signing (cached, derived once per account)
 
         Raises:
             ValueError: If account_id not found in storage
         """
-        secret = self._keypair_store.get(account_id)
-        if not secret:
+        with self._lock:
+            entry = self._lookup(account_id)
+        if entry is None:
             raise ValueError(
                 f"Account {account_id} not found in key storage. "
                 "Use create_account() or import_keypair() first."
             )
-        return Keypair.from_secret(secret)
+        return entry[1]
+
+    def get_cached(self, account_id: str) -> Optional[Keypair]:
+        """
+        Return the in-memory keypair for account_id in a single store probe
+
+        Counts as a use for the eviction policy. Unlike get_keypair() this never
+        falls back to the keystore file, so None means "not cached" rather than
+        "unknown"; callers fall back to get_keypair() on None.
+
+        Args:
+            account_id: Stellar public key (G...)
+
+        Returns:
+            Cached Keypair, or None if not held in memory (or expired)
+        """
+        with self._lock:
+            try:
+                entry = self._keypair_store[account_id]
+            except KeyError:
+                return None
+            expires = self._expiry.get(account_id) if self._expiry else None
+            if expires is not None and expires <= time.monotonic_ns():
+                # Leave expired keys to the full lookup, which deletes them
+                return None
+            self._touch(account_id, entry)
+            return entry[1]
 
     def list_accounts(self) -> list:
         """
         List all managed account public keys
 
         Returns:
-            List of account_ids (public keys)
+            List of account_ids (public keys); cached until the next
+            store/import/expiry, so callers must not mutate it
         """
-        return list(self._keypair_store.keys())
+        with self._lock:
+            if self._expiry:
+                self._purge_expired()
+            if self._list_cache is None:
+                # Always in insertion order, which the keystore file keeps (the
+                # LRU store is in recency order); the memoized read is free
+                # after our own writes. Keys only in memory (failed save) last.
+                accounts = dict.fromkeys(self._read_keystore())
+                accounts.update(dict.fromkeys(self._keypair_store))
+                self._list_cache = list(accounts)
+            return self._list_cache
 
     def export_secret(self, account_id: str) -> str:
         """
@@ -99,10 +461,11 @@ class KeyManager:
         Raises:
             ValueError: If account_id not found
         """
-        secret = self._keypair_store.get(account_id)
-        if not secret:
+        with self._lock:
+            entry = self._lookup(account_id)
+        if entry is None:
             raise ValueError(f"Account {account_id} not found in storage")
-        return secret
+        return entry[0]
 
     def import_keypair(self, secret_key: str) -> str:
         """
@@ -116,8 +479,12 @@ class KeyManager:
         """
         keypair = Keypair.from_secret(secret_key)
         account_id = keypair.public_key
-        self._keypair_store[account_id] = secret_key
-        self._save_to_file()
+        with self._lock:
+            self._cache(account_id, secret_key, keypair)
+            # Imported keys are the user's own and never expire
+            self._expiry.pop(account_id, None)
+            self._list_cache = None
+            self._save_new(account_id, secret_key)
         return account_id
 
     def has_account(self, account_id: str) -> bool:
@@ -130,4 +497,5 @@ class KeyManager:
         Returns:
             True if account exists, False otherwise
         """
-        return account_id in self._keypair_store
+        with self._lock:
+            return self._lookup(account_id) is not None
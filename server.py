@@ -4,57 +4,101 @@ FastMCP server with consolidated tools (17 → 6)
 Includes Horizon API + Soroban RPC support
 """
 
-import os
-from dotenv import load_dotenv
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastmcp import FastMCP
-from stellar_sdk import Server, Network
+from stellar_sdk import Network
+from stellar_sdk.soroban_server_async import SorobanServerAsync
 
-from stellar_ssl import create_soroban_client_with_ssl
+import clients
+from config import CONFIG
 from key_manager import KeyManager
-from stellar_tools import (
-    account_manager,
-    trading,
-    trustline_manager,
-    market_data,
-    utilities
+
+# Configuration (environment / .env is read once, in config.py)
+HORIZON_URL = CONFIG.horizon_url
+SOROBAN_RPC_URL = CONFIG.soroban_rpc_url
+STELLAR_NETWORK = CONFIG.stellar_network
+HTTP_POOL_SIZE = CONFIG.http_pool_size
+TESTNET_NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
+
+# Registered composite tools: (name, operation count, backend, banner note).
+# Trading counts buy/sell once per order_type (market, limit) plus
+# cancel_order, cancel_orders and get_orders.
+TOOL_CATALOG = (
+    ("account_manager_tool", 8, "Horizon", ""),
+    ("trading_tool", 7, "Horizon", ""),
+    ("trustline_manager_tool", 2, "Horizon", ""),
+    ("market_data_tool", 2, "Horizon", ""),
+    ("utilities_tool", 4, "Horizon", ""),
+    ("soroban_tool", 4, "Soroban RPC", " 🆕"),
 )
-from stellar_soroban import soroban_operations
 
-# Load environment variables
-load_dotenv()
+# Most recently stored managed accounts whose sequence numbers are prefetched
+# at startup (WARM_SEQUENCES=true), so their first transaction skips load_account
+WARM_ACCOUNTS = 256
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Optionally warm the sequence cache in the background while the server starts serving
+
+    Off by default: warming imports stellar_tools (and its SDK dependencies)
+    at startup, which the lazy tool imports otherwise defer to the first call.
+    """
+    if not CONFIG.warm_sequences:
+        yield {}
+        return
+    warm = asyncio.create_task(
+        _module("stellar_tools").warm_sequences(keys.list_accounts()[-WARM_ACCOUNTS:], horizon)
+    )
+    try:
+        yield {}
+    finally:
+        warm.cancel()
 
-# Configuration
-HORIZON_URL = os.getenv("HORIZON_URL", "https://horizon-testnet.stellar.org")
-SOROBAN_RPC_URL = os.getenv("SOROBAN_RPC_URL", "https://soroban-testnet.stellar.org")
-STELLAR_NETWORK = os.getenv("STELLAR_NETWORK", "testnet")
-TESTNET_NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
 
 # Initialize FastMCP server
-mcp = FastMCP("Stellar MCP Server")
+mcp = FastMCP("Stellar MCP Server", lifespan=lifespan)
 
 # Initialize Stellar SDK and KeyManager
-horizon = Server(HORIZON_URL)
-soroban = create_soroban_client_with_ssl(SOROBAN_RPC_URL)
-keys = KeyManager()
+# Both clients are process-wide singletons holding one persistent keep-alive
+# pool shared by every tool call (and any other module importing clients)
+horizon = clients.horizon(HORIZON_URL, HTTP_POOL_SIZE, CONFIG.http2)
+soroban: SorobanServerAsync = clients.soroban(SOROBAN_RPC_URL, HTTP_POOL_SIZE)
+keys = KeyManager(
+    max_keys=CONFIG.key_store_max,
+    eviction=CONFIG.key_store_eviction,
+    key_ttl=CONFIG.key_store_ttl
+)
 
 print(f"🚀 Stellar MCP Server (Composite Tools)")
 print(f"📡 Network: {STELLAR_NETWORK}")
 print(f"🌐 Horizon: {HORIZON_URL}")
 print(f"🔮 Soroban RPC: {SOROBAN_RPC_URL}")
-print(f"🔧 Tool count: 6 composite tools (was 17)")
+print(f"🔧 Tool count: {len(TOOL_CATALOG)} composite tools (was 17)")
 print()
 
 
+@lru_cache(maxsize=None)
+def _module(name: str):
+    """Import a tool implementation module on first use (keeps startup lean)"""
+    return importlib.import_module(name)
+
+
 # ============================================================================
-# COMPOSITE TOOL 1: ACCOUNT MANAGER (7 operations → 1 tool)
+# COMPOSITE TOOL 1: ACCOUNT MANAGER (8 operations → 1 tool)
 # ============================================================================
 
 @mcp.tool()
-def account_manager_tool(
+async def account_manager_tool(
     action: str,
     account_id: str = None,
     secret_key: str = None,
-    limit: int = 10
+    limit: int = 10,
+    account_ids: list[str] = None,
+    cursor: str = None
 ) -> dict:
     """
     Unified account management for Stellar operations.
@@ -62,6 +106,7 @@ def account_manager_tool(
     Actions:
         create - Generate new testnet account
         fund - Fund account via Friendbot (testnet only)
+        fund_many - Fund several accounts via Friendbot concurrently
         get - Get account details (balances, sequence, trustlines)
         transactions - Get transaction history
         list - List all managed accounts
@@ -73,32 +118,39 @@ def account_manager_tool(
         account_id: Stellar public key (G...) - required for most actions
         secret_key: Secret key (S...) - required only for import action
         limit: Transaction limit for transactions action (default: 10)
+        account_ids: Stellar public keys - required only for fund_many action
+        cursor: Paging token from a previous transactions result to fetch the
+                next (older) page; "next" continues from the last page served
     
     Examples:
         account_manager_tool(action="create")
         account_manager_tool(action="fund", account_id="G...")
+        account_manager_tool(action="fund_many", account_ids=["G...", "G..."])
         account_manager_tool(action="get", account_id="G...")
         account_manager_tool(action="list")
     
     Returns:
         Action-specific response dict with success/error status
     """
-    return account_manager(
+    return await _module("stellar_tools").account_manager(
         action=action,
         key_manager=keys,
         horizon=horizon,
         account_id=account_id,
         secret_key=secret_key,
-        limit=limit
+        limit=limit,
+        account_ids=account_ids,
+        cursor=cursor
     )
 
 
 # ============================================================================
-# COMPOSITE TOOL 2: TRADING (6 operations → 1 tool)
+# COMPOSITE TOOL 2: TRADING (7 operations → 1 tool)
+# buy/sell × market/limit, cancel_order, cancel_orders, get_orders
 # ============================================================================
 
 @mcp.tool()
-def trading_tool(
+async def trading_tool(
     action: str,
     account_id: str,
     buying_asset: str = None,
@@ -109,7 +161,10 @@ def trading_tool(
     price: str = None,
     order_type: str = "limit",
     offer_id: str = None,
-    auto_sign: bool = True
+    auto_sign: bool = True,
+    asynchronous: bool = False,
+    offer_ids: list[str] = None,
+    offer: dict = None
 ) -> dict:
     """
     Intuitive SDEX trading with explicit buying/selling semantics.
@@ -118,10 +173,11 @@ def trading_tool(
         buy - Acquire buying_asset by spending selling_asset
         sell - Give up selling_asset to acquire buying_asset
         cancel_order - Cancel an open order by offer_id
+        cancel_orders - Cancel several (or all) open orders in one transaction
         get_orders - Get all open orders for account
 
     Args:
-        action: Trading operation (buy, sell, cancel_order, get_orders)
+        action: Trading operation (buy, sell, cancel_order, cancel_orders, get_orders)
         account_id: Stellar public key (G...)
         buying_asset: Asset you want to acquire (e.g., "USDC")
         selling_asset: Asset you're spending (e.g., "XLM")
@@ -132,6 +188,11 @@ def trading_tool(
         order_type: "limit" or "market" (default: "limit")
         offer_id: Offer ID for cancel_order action
         auto_sign: Auto-sign and submit transaction (default: True)
+        asynchronous: Return {"pending": true, "hash": ...} right after submitting
+                      instead of waiting for the ledger (default: False)
+        offer_ids: Offer IDs for cancel_orders (default: all open orders, up to 100)
+        offer: An offer from get_orders, for cancel_order instead of offer_id
+               (saves a Horizon lookup)
 
     Examples:
         # Market buy 4 USDC by spending XLM
@@ -152,13 +213,16 @@ def trading_tool(
         # Cancel order
         trading_tool(action="cancel_order", account_id="G...", offer_id="12345")
 
+        # Cancel every open order in one transaction
+        trading_tool(action="cancel_orders", account_id="G...")
+
         # Get open orders
         trading_tool(action="get_orders", account_id="G...")
 
     Returns:
         {"success": bool, "hash": "...", "ledger": 123, "market_execution": {...}}
     """
-    return trading(
+    return await _module("stellar_tools").trading(
         action=action,
         account_id=account_id,
         key_manager=keys,
@@ -171,7 +235,10 @@ def trading_tool(
         price=price,
         order_type=order_type,
         offer_id=offer_id,
-        auto_sign=auto_sign
+        auto_sign=auto_sign,
+        asynchronous=asynchronous,
+        offer_ids=offer_ids,
+        offer=offer
     )
 
 
@@ -180,12 +247,13 @@ def trading_tool(
 # ============================================================================
 
 @mcp.tool()
-def trustline_manager_tool(
+async def trustline_manager_tool(
     action: str,
     account_id: str,
     asset_code: str,
     asset_issuer: str,
-    limit: str = None
+    limit: str = None,
+    asynchronous: bool = False
 ) -> dict:
     """
     Manage trustlines for issued assets (required before receiving non-XLM assets).
@@ -200,6 +268,8 @@ def trustline_manager_tool(
         asset_code: Asset code (e.g., "USDC")
         asset_issuer: Asset issuer public key (G...)
         limit: Optional trust limit (default: maximum)
+        asynchronous: Return {"pending": true, "hash": ...} right after submitting
+                      instead of waiting for the ledger (default: False)
     
     Examples:
         # Establish USDC trustline
@@ -213,14 +283,15 @@ def trustline_manager_tool(
     Returns:
         {"success": bool, "hash": "...", "message": "..."}
     """
-    return trustline_manager(
+    return await _module("stellar_tools").trustline_manager(
         action=action,
         account_id=account_id,
         asset_code=asset_code,
         asset_issuer=asset_issuer,
         key_manager=keys,
         horizon=horizon,
-        limit=limit
+        limit=limit,
+        asynchronous=asynchronous
     )
 
 
@@ -229,68 +300,86 @@ def trustline_manager_tool(
 # ============================================================================
 
 @mcp.tool()
-def market_data_tool(
+async def market_data_tool(
     action: str,
     base_asset: str = "XLM",
     quote_asset: str = None,
     quote_issuer: str = None,
-    limit: int = 20
+    limit: int = 20,
+    pairs: list[dict] = None
 ) -> dict:
     """
     Query SDEX market data for asset pairs.
     
     Actions:
         orderbook - Get bids/asks for asset pair
+        orderbooks - Get bids/asks for several pairs in one call
     
     Args:
-        action: Market data query type (orderbook)
+        action: Market data query type (orderbook, orderbooks)
         base_asset: Base asset code (default: "XLM")
         quote_asset: Quote asset code (e.g., "USDC")
         quote_issuer: Quote asset issuer (required if quote_asset != "XLM")
         limit: Number of orders per side (default: 20)
+        pairs: For orderbooks - list of {"quote_asset", "quote_issuer",
+               "base_asset" (default "XLM")} dicts
     
     Examples:
         # Get USDC/XLM orderbook
         market_data_tool(action="orderbook", quote_asset="USDC",
                         quote_issuer="GBBD...", limit=10)
+        # Get several orderbooks at once
+        market_data_tool(action="orderbooks", pairs=[
+            {"quote_asset": "USDC", "quote_issuer": "GBBD..."},
+            {"quote_asset": "EURC", "quote_issuer": "GDHU..."}])
     
     Returns:
         {"bids": [...], "asks": [...], "base": {...}, "counter": {...}}
+        (orderbooks: {"orderbooks": [...]} in the order of pairs)
     """
-    return market_data(
+    return await _module("stellar_tools").market_data(
         action=action,
         horizon=horizon,
         base_asset=base_asset,
         quote_asset=quote_asset,
         quote_issuer=quote_issuer,
-        limit=limit
+        limit=limit,
+        pairs=pairs
     )
 
 
 # ============================================================================
-# COMPOSITE TOOL 5: UTILITIES (2 operations → 1 tool)
+# COMPOSITE TOOL 5: UTILITIES (4 operations → 1 tool)
 # ============================================================================
 
 @mcp.tool()
-def utilities_tool(action: str) -> dict:
+async def utilities_tool(action: str, tx_hash: str = None, signed_xdr: str = None) -> dict:
     """
     Network utilities and server information.
 
     Actions:
         status - Get Horizon server status and health
         fee - Estimate current transaction fee
+        tx_status - Check a transaction submitted with asynchronous=True
+        submit - Submit a transaction signed elsewhere (e.g. auto_sign=False + wallet)
 
     Args:
-        action: Utility operation (status or fee)
+        action: Utility operation (status, fee, tx_status or submit)
+        tx_hash: Transaction hash (for tx_status)
+        signed_xdr: Signed transaction envelope XDR (for submit)
 
     Examples:
         utilities_tool(action="status")
         utilities_tool(action="fee")
+        utilities_tool(action="tx_status", tx_hash="abc123...")
+        utilities_tool(action="submit", signed_xdr="AAAAAgAAAA...")
 
     Returns:
         Action-specific utility data
     """
-    return utilities(action=action, horizon=horizon)
+    return await _module("stellar_tools").utilities(
+        action=action, horizon=horizon, tx_hash=tx_hash, signed_xdr=signed_xdr
+    )
 
 
 # ============================================================================
@@ -397,7 +486,7 @@ async def soroban_tool(
     Returns:
         Action-specific response dict with success/error status
     """
-    return await soroban_operations(
+    return await _module("stellar_soroban").soroban_operations(
         action=action,
         soroban_server=soroban,
         key_manager=keys,
@@ -421,12 +510,8 @@ async def soroban_tool(
 
 if __name__ == "__main__":
     print("🔧 Registered composite tools:")
-    print("   1. account_manager_tool (7 operations) [Horizon]")
-    print("   2. trading_tool (6 operations) [Horizon]")
-    print("   3. trustline_manager_tool (2 operations) [Horizon]")
-    print("   4. market_data_tool (2 operations) [Horizon]")
-    print("   5. utilities_tool (2 operations) [Horizon]")
-    print("   6. soroban_tool (4 operations) [Soroban RPC] 🆕")
+    for i, (name, operations, backend, note) in enumerate(TOOL_CATALOG, 1):
+        print(f"   {i}. {name} ({operations} operations) [{backend}]{note}")
     print()
     print("📊 Token savings: ~70% reduction vs previous version (17 tools)")
     print("⚡ Workflow simplification: 1-2 calls vs 3-5 calls")
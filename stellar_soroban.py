@@ -7,10 +7,17 @@ from stellar_sdk import TransactionBuilder, scval
 from stellar_sdk.soroban_server_async import SorobanServerAsync
 from stellar_sdk.soroban_rpc import EventFilter, EventFilterType, GetEventsRequest
 from key_manager import KeyManager
+from ttl_cache import TTLCache
 from typing import Optional, Dict, Any
 import json
 
 
+# (server_url, account_id) -> Account last loaded for a simulation. Simulation
+# never checks the source sequence number, so a recently loaded account is
+# reused instead of re-fetched (build() bumping its sequence is harmless here).
+_simulation_sources = TTLCache(maxsize=256, ttl=30.0)
+
+
 def _parse_parameters(parameters_json: str) -> list:
     """
     Convert JSON parameter specification to scval objects.
@@ -126,8 +133,12 @@ async def soroban_operations(
             if not contract_id or not function_name or not source_account:
                 return {"error": "contract_id, function_name, and source_account required"}
 
-            # Load account
-            source = await soroban_server.load_account(source_account)
+            # Load account (any recent sequence will do for a simulation)
+            source_key = (soroban_server.server_url, source_account)
+            source = _simulation_sources.get(source_key)
+            if source is None:
+                source = await soroban_server.load_account(source_account)
+                _simulation_sources.set(source_key, source)
 
             # Parse parameters
             scval_params = _parse_parameters(parameters) if parameters else []
@@ -174,7 +185,7 @@ async def soroban_operations(
 
             # Get keypair for signing
             if auto_sign:
-                keypair = key_manager.get_keypair(source_account)
+                keypair = key_manager.get_cached(source_account) or key_manager.get_keypair(source_account)
 
             # Load account
             source = await soroban_server.load_account(source_account)
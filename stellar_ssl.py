@@ -6,18 +6,48 @@ This module provides SSL-configured clients that work across all platforms
 (macOS, Linux, Windows) without requiring environment variable configuration.
 """
 
+import asyncio
+import json
 import ssl
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
 try:
     import certifi
     import aiohttp
-    from stellar_sdk.client.aiohttp_client import AiohttpClient
+    from stellar_sdk.client.aiohttp_client import AiohttpClient, IDENTIFICATION_HEADERS
+    from stellar_sdk.client.base_async_client import BaseAsyncClient
+    from stellar_sdk.client.response import Response
     from stellar_sdk.client import defines
+    from stellar_sdk.exceptions import ConnectionError
     _DEPS_AVAILABLE = True
 except ImportError:
     _DEPS_AVAILABLE = False
 
+# Optional: httpx (with h2) for the HTTP/2 client
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+# Optional: orjson parses large Horizon payloads (histories, orderbooks)
+# several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Statuses worth retrying: rate limiting and transient gateway errors. POSTs
+# (transaction submits) are only retried on 429, which means "not processed".
+_RETRY_GET_STATUSES = frozenset((429, 502, 503, 504))
+_RETRY_POST_STATUSES = frozenset((429,))
+# Upper bound on any single retry wait, including server-sent Retry-After
+_MAX_RETRY_DELAY = 10.0
+# Once a response reports this few requests left in the rate-limit window,
+# new requests wait for the window to reset (X-RateLimit-Reset) instead of
+# spending the remainder and collecting 429s
+_RATE_LIMIT_FLOOR = 1
+
 
 def create_ssl_context() -> ssl.SSLContext:
     """Create SSL context with certifi's CA bundle.
@@ -42,7 +72,90 @@ def create_ssl_context() -> ssl.SSLContext:
     return context
 
 
-class StellarAiohttpClient(AiohttpClient):
+if _DEPS_AVAILABLE:
+    class _OrjsonResponse(Response):
+        """Response whose json() decodes with orjson (stdlib json as fallback)"""
+
+        def json(self) -> dict:
+            try:
+                return orjson.loads(self.text)
+            except orjson.JSONDecodeError:
+                # stdlib accepts a few non-standard forms (NaN, Infinity) orjson rejects
+                return json.loads(self.text)
+
+
+class _RequestPolicy:
+    """Concurrency cap, rate-limit pacing/retries and optional orjson decoding.
+
+    Shared by the aiohttp and httpx clients; call _init_request_policy() from
+    __init__ and route requests through _send().
+    """
+
+    def _init_request_policy(self, max_concurrency: Optional[int], max_retries: int, fast_json: bool):
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._max_retries = max_retries
+        self._fast_json = fast_json and orjson is not None
+        # Loop time before which new requests hold off (rate-limit window spent)
+        self._throttle_until = 0.0
+
+    def _note_rate_limit(self, response: "Response"):
+        """Hold off new requests if response says the rate-limit window is spent"""
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = float(headers.get("x-ratelimit-reset", 1))
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining <= _RATE_LIMIT_FLOOR:
+            self._throttle_until = asyncio.get_running_loop().time() + min(reset, _MAX_RETRY_DELAY)
+
+    def _retry_delay(self, response: Optional["Response"], attempt: int) -> float:
+        """Seconds to wait before retry `attempt`
+
+        A numeric Retry-After wins; a 429 without one waits out the rate-limit
+        window (X-RateLimit-Reset, as Horizon sends); otherwise back off
+        exponentially.
+        """
+        headers = {k.lower(): v for k, v in response.headers.items()} if response is not None else {}
+        retry_after = headers.get("retry-after")
+        if retry_after is None and response is not None and response.status_code == 429:
+            retry_after = headers.get("x-ratelimit-reset")
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = (self.backoff_factor or 0.5) * (2 ** attempt)
+        return min(delay, _MAX_RETRY_DELAY)
+
+    async def _send(self, request, retry_statuses: frozenset, retry_connection_errors: bool = False) -> "Response":
+        """Run request() under the concurrency limit, retrying retry_statuses
+
+        With retry_connection_errors, transport failures (a pooled keep-alive
+        connection the server already closed, a reset) are retried as well.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(self._max_retries + 1):
+            if self._throttle_until > loop.time():
+                await asyncio.sleep(self._throttle_until - loop.time())
+            try:
+                if self._semaphore is None:
+                    response = await request()
+                else:
+                    async with self._semaphore:
+                        response = await request()
+            except ConnectionError:
+                if not retry_connection_errors or attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(None, attempt))
+                continue
+            self._note_rate_limit(response)
+            if response.status_code not in retry_statuses or attempt == self._max_retries:
+                if not self._fast_json:
+                    return response
+                return _OrjsonResponse(response.status_code, response.text, response.headers, response.url)
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+
+class StellarAiohttpClient(_RequestPolicy, AiohttpClient):
     """Extended AiohttpClient with proper SSL certificate handling.
 
     This client automatically configures SSL using certifi's CA bundle,
@@ -70,6 +183,10 @@ class StellarAiohttpClient(AiohttpClient):
         backoff_factor: Optional[float] = 0.5,
         user_agent: Optional[str] = None,
         custom_headers: Optional[Dict[str, str]] = None,
+        keepalive_timeout: float = 60.0,
+        max_concurrency: Optional[int] = 64,
+        max_retries: int = 3,
+        fast_json: bool = False,
         **kwargs,
     ) -> None:
         """Initialize SSL-configured aiohttp client.
@@ -81,6 +198,16 @@ class StellarAiohttpClient(AiohttpClient):
             backoff_factor: Backoff factor for retries
             user_agent: Custom user agent string
             custom_headers: Additional HTTP headers to include
+            keepalive_timeout: Seconds an idle pooled connection stays open, so
+                calls spaced out between agent turns skip the TLS handshake
+            max_concurrency: Max in-flight requests (None for unbounded); extra
+                requests queue instead of piling onto the server
+            max_retries: Retries for rate-limited / gateway-error responses
+                (and GET connection errors), honoring Retry-After or backing
+                off exponentially
+            fast_json: Decode responses with orjson when installed. Only for
+                APIs that never send integers beyond 64 bits (orjson may turn
+                them into floats); Horizon encodes all such values as strings.
             **kwargs: Additional arguments passed to ClientSession
         """
         super().__init__(
@@ -94,6 +221,8 @@ class StellarAiohttpClient(AiohttpClient):
         )
         # Store SSL context for use during session initialization
         self._ssl_context = create_ssl_context()
+        self._keepalive_timeout = keepalive_timeout
+        self._init_request_policy(max_concurrency, max_retries, fast_json)
 
     async def _StellarAiohttpClient__init_session(self):
         """Initialize session with SSL-configured connector.
@@ -104,11 +233,15 @@ class StellarAiohttpClient(AiohttpClient):
         if self._session is None:
             # Create connector with SSL context
             if self.pool_size is None:
-                connector = aiohttp.TCPConnector(ssl=self._ssl_context)
+                connector = aiohttp.TCPConnector(
+                    ssl=self._ssl_context,
+                    keepalive_timeout=self._keepalive_timeout
+                )
             else:
                 connector = aiohttp.TCPConnector(
                     limit=self.pool_size,
-                    ssl=self._ssl_context
+                    ssl=self._ssl_context,
+                    keepalive_timeout=self._keepalive_timeout
                 )
 
             # Create session with SSL-configured connector
@@ -122,15 +255,171 @@ class StellarAiohttpClient(AiohttpClient):
     # Alias the method to match parent's name mangling
     _AiohttpClient__init_session = _StellarAiohttpClient__init_session
 
+    async def get(self, url: str, params: Optional[Dict[str, str]] = None) -> "Response":
+        """Perform HTTP GET request (bounded concurrency, retried on 429/5xx gateway and connection errors)."""
+        return await self._send(
+            lambda: super(StellarAiohttpClient, self).get(url, params), _RETRY_GET_STATUSES, retry_connection_errors=True
+        )
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Dict[str, str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> "Response":
+        """Perform HTTP POST request (bounded concurrency, retried on 429)."""
+        return await self._send(
+            lambda: super(StellarAiohttpClient, self).post(url, data, json_data), _RETRY_POST_STATUSES
+        )
+
+    async def stream(self, url: str, params: Optional[Dict[str, str]] = None):
+        """Perform SSE stream request over an SSL-configured session.
+
+        The parent lazily opens its SSE session with default SSL settings;
+        creating it here first makes streams use the certifi context too.
+        """
+        if self._sse_session is None:
+            self._sse_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self._ssl_context),
+                timeout=aiohttp.ClientTimeout(total=60 * 5),
+            )
+        async for message in super().stream(url, params):
+            yield message
+
+
+class StellarHttpxClient(_RequestPolicy, BaseAsyncClient):
+    """HTTP/2 client (httpx) with certifi SSL, for Horizon.
+
+    Concurrent requests are multiplexed as streams over a few TLS connections
+    instead of each needing its own HTTP/1.1 connection. Same concurrency cap,
+    retry and fast_json behavior as StellarAiohttpClient. SSE streams run over
+    HTTP/1.1 through an internal StellarAiohttpClient (same certifi SSL).
+
+    Requires: pip install "httpx[http2]"
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        request_timeout: float = defines.DEFAULT_GET_TIMEOUT_SECONDS,
+        post_timeout: float = defines.DEFAULT_POST_TIMEOUT_SECONDS,
+        backoff_factor: Optional[float] = 0.5,
+        user_agent: Optional[str] = None,
+        custom_headers: Optional[Dict[str, str]] = None,
+        keepalive_timeout: float = 60.0,
+        max_concurrency: Optional[int] = 64,
+        max_retries: int = 3,
+        fast_json: bool = False,
+    ) -> None:
+        """Initialize SSL-configured HTTP/2 client.
+
+        Args:
+            pool_size: Max connections (None for unlimited)
+            request_timeout: Timeout for GET requests in seconds
+            post_timeout: Timeout for POST requests in seconds
+            backoff_factor: Backoff factor for retries
+            user_agent: Custom user agent string
+            custom_headers: Additional HTTP headers to include
+            keepalive_timeout: Seconds an idle connection stays open
+            max_concurrency: Max in-flight requests (None for unbounded)
+            max_retries: Retries for rate-limited / gateway-error responses
+                (and GET connection errors)
+            fast_json: Decode responses with orjson when installed
+
+        Raises:
+            ImportError: If httpx or h2 is not installed
+        """
+        if not _HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx not installed. Install with: pip install 'httpx[http2]'"
+            )
+        self.backoff_factor = backoff_factor
+        self.post_timeout = post_timeout
+        self._user_agent = user_agent
+        self._custom_headers = custom_headers
+        # aiohttp client for SSE streams, created on the first stream() call
+        self._sse_client: Optional[StellarAiohttpClient] = None
+        headers = dict(IDENTIFICATION_HEADERS)
+        if user_agent:
+            headers["User-Agent"] = user_agent
+        if custom_headers:
+            headers.update(custom_headers)
+        # httpx raises ImportError here when h2 is missing
+        self._client = httpx.AsyncClient(
+            http2=True,
+            verify=create_ssl_context(),
+            headers=headers,
+            timeout=request_timeout,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_timeout
+            ),
+        )
+        self._init_request_policy(max_concurrency, max_retries, fast_json)
+
+    async def _request(self, method: str, url: str, **kwargs) -> "Response":
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise ConnectionError(e)
+        return Response(
+            status_code=response.status_code,
+            text=response.text,
+            headers=dict(response.headers),
+            url=str(response.url),
+        )
+
+    async def get(self, url: str, params: Optional[Dict[str, str]] = None) -> "Response":
+        """Perform HTTP GET request (bounded concurrency, retried on 429/5xx gateway and connection errors)."""
+        return await self._send(
+            lambda: self._request("GET", url, params=params), _RETRY_GET_STATUSES, retry_connection_errors=True
+        )
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Dict[str, str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> "Response":
+        """Perform HTTP POST request (bounded concurrency, retried on 429)."""
+        return await self._send(
+            lambda: self._request("POST", url, data=data, json=json_data, timeout=self.post_timeout),
+            _RETRY_POST_STATUSES
+        )
+
+    async def stream(self, url: str, params: Optional[Dict[str, str]] = None):
+        """Perform SSE stream request over an SSL-configured aiohttp session.
+
+        The SDK's SSE client is aiohttp-based, so streams are delegated to a
+        lazily created StellarAiohttpClient with the same headers.
+        """
+        if self._sse_client is None:
+            self._sse_client = StellarAiohttpClient(
+                user_agent=self._user_agent,
+                custom_headers=self._custom_headers,
+            )
+        async for message in self._sse_client.stream(url, params):
+            yield message
+
+    async def close(self) -> None:
+        """Close the underlying connection pool (and SSE session, if opened)."""
+        await self._client.aclose()
+        if self._sse_client is not None:
+            await self._sse_client.close()
+
 
-def create_soroban_client_with_ssl(server_url: str):
+def create_soroban_client_with_ssl(server_url: str, pool_size: Optional[int] = None):
     """Create Soroban RPC client with proper SSL certificate handling.
 
     This is a convenience function that creates a SorobanServerAsync instance
     with SSL properly configured for macOS Python 3.6+ and all other platforms.
+    The client keeps a persistent keep-alive connection pool, so repeated RPC
+    calls reuse sockets instead of paying a TLS handshake each time.
 
     Args:
         server_url: Soroban RPC endpoint URL (e.g., "https://soroban-testnet.stellar.org")
+        pool_size: Connection pool size (None for unlimited)
 
     Returns:
         SorobanServerAsync: Configured Soroban RPC client
@@ -149,5 +438,5 @@ def create_soroban_client_with_ssl(server_url: str):
 
     from stellar_sdk.soroban_server_async import SorobanServerAsync
 
-    client = StellarAiohttpClient()
+    client = StellarAiohttpClient(pool_size=pool_size)
     return SorobanServerAsync(server_url=server_url, client=client)
@@ -4,30 +4,142 @@ Consolidated tool implementations reducing 17 tools to 5 composite tools.
 """
 
 from stellar_sdk import (
-    Server,
+    ServerAsync,
     TransactionBuilder,
     Keypair,
     Network,
     Asset,
+    Account,
     TransactionEnvelope,
 )
-import requests
+from stellar_sdk.exceptions import BadRequestError, BaseHorizonError, NotFoundError, raise_request_exception
+from stellar_sdk.helpers import parse_transaction_envelope_from_xdr
+from stellar_sdk.sep.exceptions import AccountRequiresMemoError
+from stellar_sdk.utils import urljoin_with_query
+from stellar_sdk.xdr import TransactionResult, TransactionResultCode
+import asyncio
+import clients
+import json
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 from key_manager import KeyManager
-from typing import Optional, Dict, Any
+from ttl_cache import TTLCache
+from typing import Optional, Dict, Any, List, Callable
 from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
 
 # Constants
 TESTNET_NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
 FRIENDBOT_URL = "https://friendbot.stellar.org"
-
-
+# Max concurrent Friendbot requests for fund_many (stays under its rate limit)
+_FRIENDBOT_CONCURRENCY = 32
+# Testnet ledger close time; an asynchronous submit Core answered with
+# TRY_AGAIN_LATER is retried once after this long
+_LEDGER_CLOSE_SECONDS = 5.0
+# Max orderbook requests in flight for one "orderbooks" call; Horizon rate
+# limits per IP, so a wide fan-out would only trade latency for 429s
+_ORDERBOOK_CONCURRENCY = 5
+# Horizon's maximum page size, used when paging open offers
+_OFFERS_PAGE_SIZE = 200
+# Offer operation per order action; amount is in the asset the action names:
+# buy -> manage_buy_offer (buying_asset amount), sell -> manage_sell_offer
+# (selling_asset amount)
+_ORDER_OPS = {
+    "buy": TransactionBuilder.append_manage_buy_offer_op,
+    "sell": TransactionBuilder.append_manage_sell_offer_op,
+}
+# Protocol limit on operations in one transaction
+_MAX_OPS_PER_TX = 100
+# Transaction summary fields returned by account_manager(action="transactions");
+# itemgetter pulls them all from a Horizon record in one C-level call
+_TX_FIELDS = ("hash", "ledger", "created_at", "source_account", "fee_charged", "operation_count", "successful")
+_tx_columns = itemgetter(*_TX_FIELDS)
+# Offer fields returned by trading(action="get_orders"); likewise
+# pulled from a Horizon record in one itemgetter call
+_OFFER_FIELDS = ("id", "selling", "buying", "amount", "price", "last_modified_ledger")
+_offer_columns = itemgetter(*_OFFER_FIELDS)
+
+# Short-lived caches for read-only Horizon queries that agents tend to repeat
+# with identical arguments within one reasoning turn. TTLs stay at or below
+# the ~5s ledger close time so results are never more than a ledger stale.
+# Account reads are also invalidated whenever this process writes to or
+# funds the account.
+_orderbook_cache = TTLCache(maxsize=1024, ttl=0.5)
+_account_cache = TTLCache(maxsize=1024, ttl=2.0)
+_transactions_cache = TTLCache(maxsize=1024, ttl=5.0)
+_utilities_cache = TTLCache(maxsize=8, ttl=5.0)
+# Offer records seen by get_orders or cancel_order, so cancelling an offer
+# right after listing it skips the per-offer lookup. An offer's assets never
+# change; if it was filled or cancelled meanwhile, Core rejects the cancel.
+_offer_cache = TTLCache(maxsize=1024, ttl=2.0)
+# Latest snapshot per orderbook followed by a running stream_orderbook();
+# Horizon pushes every change, so these never go stale while the stream lives
+_streamed_orderbooks: Dict[tuple, Dict[str, Any]] = {}
+
+
+@dataclass(slots=True)
+class _PendingSubmit:
+    """An asynchronous=True submit Stellar Core accepted, awaiting ledger inclusion"""
+
+    hash: str
+    task: asyncio.Task  # wait_for_tx() polling Horizon for the result
+    submitted_at: float  # time.monotonic() when the submit was started
+
+
+# Accepted asynchronous submits keyed by tx hash until their outcome is read via
+# utilities(action="tx_status")
+_pending_submits: Dict[str, _PendingSubmit] = {}
+# Finished-but-unread submits are pruned once this many are tracked
+_MAX_PENDING_SUBMITS = 1024
+
+# Ed25519 signing runs here (libsodium releases the GIL) so concurrent submits
+# sign in parallel without blocking the event loop or the default executor
+_signing_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tx-sign")
+
+# account_id -> sequence number of the last transaction this process reserved
+# for it, so follow-up transactions skip load_account. Dropped on any submit
+# failure; the next transaction then refetches from Horizon.
+_sequences: Dict[str, int] = {}
+# account_id -> lock held from build through submit. Stellar Core queues at
+# most one transaction per source account, so a second submit in flight for
+# the same account would be rejected with TRY_AGAIN_LATER. Entries vanish
+# once no submit holds (or waits on) the lock.
+_source_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+# account_id -> wait_for_tx() task of its last accepted asynchronous submit.
+# That transaction sits in Core's queue until its ledger closes, so the next
+# submit from the account waits for it (under the account's lock) first.
+_inflight_submits: Dict[str, asyncio.Task] = {}
+
+
+# The native asset has no per-call state, so one shared instance serves every
+# caller (like the memoized assets below, it must never be mutated)
+_NATIVE = Asset.native()
+
+
+@lru_cache(maxsize=256)
 def _dict_to_asset(asset_code: str, asset_issuer: Optional[str] = None) -> Asset:
-    """Convert asset code/issuer to Stellar SDK Asset object"""
-    if asset_code.upper() == "XLM" or asset_issuer is None:
-        return Asset.native()
+    """
+    Convert asset code/issuer to Stellar SDK Asset object
+
+    Memoized: trading loops hit the same few pairs, so the issuer StrKey
+    decode/checksum runs once per pair. Callers must not mutate the result.
+    """
+    if asset_issuer is None or asset_code.upper() == "XLM":
+        return _NATIVE
     return Asset(asset_code, asset_issuer)
 
 
+def _horizon_asset(asset: Dict[str, str]) -> Asset:
+    """Asset for a Horizon asset dict ({"asset_type", "asset_code", "asset_issuer"})"""
+    if asset["asset_type"] == "native":
+        return _NATIVE
+    return _dict_to_asset(asset["asset_code"], asset["asset_issuer"])
+
+
 def _calculate_market_fill(
     orderbook: Dict[str, Any],
     amount: str,
@@ -173,15 +285,180 @@ def _calculate_market_fill(
         }
 
 
-def _build_sign_submit(
+def _track_submit(tx_hash: str, task: asyncio.Task):
+    """Remember an accepted submit, pruning finished ones nobody asked about"""
+    if len(_pending_submits) >= _MAX_PENDING_SUBMITS:
+        for done_hash in [h for h, p in _pending_submits.items() if p.task.done()]:
+            done = _pending_submits.pop(done_hash).task
+            if not done.cancelled():
+                done.exception()  # mark any failure as retrieved
+    _pending_submits[tx_hash] = _PendingSubmit(tx_hash, task, time.monotonic())
+
+
+class _TestnetTransactionBuilder(TransactionBuilder):
+    """TransactionBuilder with this server's fixed testnet passphrase and base fee"""
+
+    def __init__(self, source_account: Account):
+        super().__init__(source_account, TESTNET_NETWORK_PASSPHRASE, 100)
+
+
+async def _load_source_account(account_id: str, horizon: ServerAsync) -> Account:
+    """Source account for a new transaction: cached sequence if known, else Horizon"""
+    sequence = _sequences.get(account_id)
+    if sequence is not None:
+        return Account(account_id, sequence)
+    return await horizon.load_account(account_id)
+
+
+async def warm_sequences(account_ids: List[str], horizon: ServerAsync) -> int:
+    """
+    Prefetch sequence numbers so the first transaction per account skips load_account
+
+    Args:
+        account_ids: Stellar public keys to warm
+        horizon: Horizon server instance
+
+    Returns:
+        Number of accounts warmed (unfunded/unreachable ones load on first use)
+    """
+    async def warm(account_id: str) -> bool:
+        try:
+            account = await horizon.load_account(account_id)
+        except Exception:
+            return False
+        # A transaction submitted meanwhile already holds a newer sequence
+        _sequences.setdefault(account_id, account.sequence)
+        return True
+
+    return sum(await asyncio.gather(*(warm(account_id) for account_id in account_ids)))
+
+
+def _source_lock(account_id: str) -> asyncio.Lock:
+    """The lock serializing submits from account_id (created on first use)"""
+    lock = _source_locks.get(account_id)
+    if lock is None:
+        lock = _source_locks[account_id] = asyncio.Lock()
+    return lock
+
+
+async def _await_previous_submit(account_id: str):
+    """Wait until account_id's last asynchronous submit has left Core's queue"""
+    task = _inflight_submits.get(account_id)
+    if task is not None and not task.done():
+        await asyncio.wait((task,))
+
+
+def _clear_inflight(account_id: str, task: asyncio.Task):
+    """Done-callback for accepted submits: stop tracking task as account_id's last"""
+    if _inflight_submits.get(account_id) is task:
+        del _inflight_submits[account_id]
+
+
+def _is_bad_seq(e: Exception) -> bool:
+    """True if a submit was rejected because the source sequence was stale"""
+    if not isinstance(e, BadRequestError):
+        return False
+    result_codes = (e.extras or {}).get("result_codes") or {}
+    return result_codes.get("transaction") == "tx_bad_seq"
+
+
+def _invalidate_account_reads(horizon: ServerAsync, account_id: str):
+    """Drop cached account details / history after a write to account_id"""
+    _account_cache.pop((horizon.horizon_url, account_id))
+    _transactions_cache.pop((horizon.horizon_url, account_id))
+
+
+def _sign(tx: TransactionEnvelope, keypair: Keypair) -> str:
+    """
+    Sign tx with keypair and return its hash (hex)
+
+    TransactionEnvelope.sign() hashes the signature base (an XDR encode of
+    the transaction plus SHA-256) and hash_hex() would do it all again; the
+    one hash serves both. The network id is already derived once per
+    envelope by the SDK.
+    """
+    tx_hash = tx.hash()
+    tx.signatures.append(keypair.sign_decorated(tx_hash))
+    return tx_hash.hex()
+
+
+async def _submit_async(horizon: ServerAsync, tx) -> Dict[str, Any]:
+    """
+    POST tx to Horizon's /transactions_async and return Stellar Core's verdict
+
+    Horizon answers as soon as Core has checked the transaction, with
+    {"tx_status": PENDING | DUPLICATE | ERROR | TRY_AGAIN_LATER, "hash": ...}.
+    Non-PENDING statuses arrive as HTTP errors; their body is returned as-is.
+    """
+    try:
+        return await horizon.submit_transaction_async(tx)
+    except BaseHorizonError as e:
+        try:
+            body = json.loads(e.message)
+        except ValueError:
+            raise e
+        if not isinstance(body, dict) or "tx_status" not in body:
+            raise
+        return body
+
+
+def _async_result_code(response: Dict[str, Any]) -> Optional[TransactionResultCode]:
+    """Result code of a transaction Core rejected (tx_status ERROR), if present"""
+    error_xdr = response.get("errorResultXdr") or response.get("error_result_xdr")
+    if not error_xdr:
+        return None
+    return TransactionResult.from_xdr(error_xdr).result.code
+
+
+async def wait_for_tx(tx_hash: str, horizon: ServerAsync, timeout: float = 60.0) -> Dict[str, Any]:
+    """
+    Poll Horizon until a submitted transaction has been ingested
+
+    Args:
+        tx_hash: Transaction hash
+        horizon: Horizon server instance
+        timeout: Seconds to keep polling
+
+    Returns:
+        Horizon's transaction record ("successful", "ledger", ...)
+
+    Raises:
+        TimeoutError: If the transaction is not in a ledger after timeout seconds
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.5
+    while True:
+        try:
+            return await horizon.transactions().transaction(tx_hash).call()
+        except NotFoundError:
+            if loop.time() + delay > deadline:
+                raise TimeoutError(f"Transaction {tx_hash} not in a ledger after {timeout}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 4.0)
+
+
+def _forget_sequence_on_failure(account_id: str, task: asyncio.Task):
+    """Done-callback for accepted submits: drop the cached sequence if it failed"""
+    if task.cancelled() or task.exception() is not None or not task.result().get("successful"):
+        _sequences.pop(account_id, None)
+
+
+async def _build_sign_submit(
     account_id: str,
     operations: list,
     key_manager: KeyManager,
-    horizon: Server,
-    auto_sign: bool = True
+    horizon: ServerAsync,
+    auto_sign: bool = True,
+    account: Optional[Account] = None,
+    asynchronous: bool = False
 ) -> Dict[str, Any]:
     """
     Unified transaction flow: build → sign → submit
+
+    Signed submits from the same source account run one at a time, since
+    Stellar Core holds at most one queued transaction per source account;
+    a submit after an asynchronous one first waits for that to reach a ledger.
     
     Args:
         account_id: Stellar public key
@@ -189,42 +466,117 @@ def _build_sign_submit(
         key_manager: KeyManager instance
         horizon: Horizon server instance
         auto_sign: If True, automatically sign and submit
+        account: Source account already loaded by the caller (otherwise the
+            cached sequence is used, falling back to load_account)
+        asynchronous: Submit via /transactions_async and return a pending
+            ticket once Stellar Core accepts the transaction, instead of
+            waiting for the ledger to close
 
     Returns:
-        Transaction result or unsigned XDR if auto_sign=False
+        Transaction result, pending ticket if asynchronous, or unsigned XDR if auto_sign=False
     """
     try:
-        account = horizon.load_account(account_id)
-        tx_builder = TransactionBuilder(
-            source_account=account,
-            network_passphrase=TESTNET_NETWORK_PASSPHRASE,
-            base_fee=100
-        )
-        
-        # Add all operations
-        for op in operations:
-            op(tx_builder)
-        
-        tx = tx_builder.build()
-        
-        if not auto_sign:
-            return {
-                "xdr": tx.to_xdr(),
-                "tx_hash": tx.hash().hex(),
-                "message": "Transaction built (unsigned). Call with auto_sign=True to submit."
-            }
-        
-        # Sign and submit
-        keypair = key_manager.get_keypair(account_id)
-        tx.sign(keypair)
-        response = horizon.submit_transaction(tx)
-        
-        return {
-            "success": response.get("successful", False),
-            "hash": response.get("hash"),
-            "ledger": response.get("ledger"),
-            "message": "Transaction submitted successfully"
-        }
+        # Resolve the signing key first (one store probe when cached) so an
+        # unknown account fails before any Horizon round trip
+        keypair = None
+        if auto_sign:
+            keypair = key_manager.get_cached(account_id) or key_manager.get_keypair(account_id)
+        # Signed submits from one source run one at a time (see _source_locks);
+        # unsigned builds need no turn
+        async with _source_lock(account_id) if auto_sign else nullcontext():
+            if auto_sign:
+                await _await_previous_submit(account_id)
+            # A stale cached sequence (tx_bad_seq) gets one rebuild from a fresh load
+            for attempt in range(2):
+                if account is None:
+                    account = await _load_source_account(account_id, horizon)
+                tx_builder = _TestnetTransactionBuilder(account)
+
+                # Add all operations
+                for op in operations:
+                    op(tx_builder)
+
+                if auto_sign:
+                    # Another submit for this account may have reserved sequences
+                    # since account was loaded; continue after the newest one
+                    account.sequence = max(account.sequence, _sequences.get(account_id, 0))
+                # build() advances account.sequence to this transaction's sequence
+                tx = tx_builder.build()
+
+                if not auto_sign:
+                    return {
+                        "xdr": tx.to_xdr(),
+                        "tx_hash": tx.hash().hex(),
+                        "message": "Transaction built (unsigned). Call with auto_sign=True to submit, "
+                                   "or sign it and submit with utilities(action='submit', signed_xdr=...)."
+                    }
+
+                # Reserve the sequence for the next submit from this account;
+                # assume it lands (failures below drop the cached value)
+                _sequences[account_id] = account.sequence
+                tx_hash = await asyncio.get_running_loop().run_in_executor(_signing_executor, _sign, tx, keypair)
+
+                if asynchronous:
+                    try:
+                        response = await _submit_async(horizon, tx)
+                    except Exception:
+                        _sequences.pop(account_id, None)
+                        raise
+                    status = response.get("tx_status")
+                    if status not in ("PENDING", "DUPLICATE"):
+                        # Rejected before reaching a ledger: the sequence was not consumed
+                        _sequences.pop(account_id, None)
+                        code = _async_result_code(response)
+                        if attempt == 0 and code == TransactionResultCode.txBAD_SEQ:
+                            account = None
+                            continue
+                        if attempt == 0 and status == "TRY_AGAIN_LATER":
+                            # Another transaction from this account (submitted
+                            # elsewhere) is queued: retry once its ledger closed
+                            await asyncio.sleep(_LEDGER_CLOSE_SECONDS)
+                            account = None
+                            continue
+                        return {
+                            "success": False,
+                            "hash": tx_hash,
+                            "status": status,
+                            "error": f"Transaction rejected by Stellar Core: {code.name if code else status}"
+                        }
+
+                    # Accepted; inclusion is tracked in the background for tx_status
+                    task = asyncio.create_task(wait_for_tx(tx_hash, horizon))
+                    task.add_done_callback(lambda t: _forget_sequence_on_failure(account_id, t))
+                    task.add_done_callback(lambda t: _invalidate_account_reads(horizon, account_id))
+                    task.add_done_callback(lambda t: _clear_inflight(account_id, t))
+                    _inflight_submits[account_id] = task
+                    _track_submit(tx_hash, task)
+                    return {
+                        "success": True,
+                        "pending": True,
+                        "hash": tx_hash,
+                        "message": "Transaction accepted and awaiting ledger inclusion. "
+                                   "Check it with utilities(action='tx_status', tx_hash=...)."
+                    }
+
+                try:
+                    response = await horizon.submit_transaction(tx)
+                except Exception as e:
+                    _sequences.pop(account_id, None)
+                    _invalidate_account_reads(horizon, account_id)
+                    if attempt == 0 and _is_bad_seq(e):
+                        account = None
+                        continue
+                    raise
+                if not response.get("successful", False):
+                    _sequences.pop(account_id, None)
+                _invalidate_account_reads(horizon, account_id)
+
+                return {
+                    "success": response.get("successful", False),
+                    "hash": response.get("hash"),
+                    "ledger": response.get("ledger"),
+                    "message": "Transaction submitted successfully"
+                }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -233,21 +585,26 @@ def _build_sign_submit(
 # COMPOSITE TOOL 1: ACCOUNT MANAGER
 # ============================================================================
 
-def account_manager(
+async def account_manager(
     action: str,
     key_manager: KeyManager,
-    horizon: Server,
+    horizon: ServerAsync,
     account_id: Optional[str] = None,
     secret_key: Optional[str] = None,
-    limit: int = 10
+    limit: int = 10,
+    cache_bypass: bool = False,
+    account_ids: Optional[List[str]] = None,
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Unified account management tool consolidating 7 operations.
+    Unified account management tool consolidating 8 operations.
     
     Actions:
         - "create": Generate new testnet account
         - "fund": Fund account via Friendbot (testnet only)
-        - "get": Get account details (balances, sequence, trustlines)
+        - "fund_many": Fund several accounts via Friendbot concurrently
+        - "get": Get account details (balances, sequence, trustlines); balances
+          are also keyed by asset ("XLM" / "CODE:ISSUER") in balances_by_asset
         - "transactions": Get transaction history
         - "list": List all managed accounts
         - "export": Export secret key (⚠️ dangerous!)
@@ -260,127 +617,237 @@ def account_manager(
         account_id: Stellar public key (required for most actions)
         secret_key: Secret key (required only for "import")
         limit: Transaction limit (for "transactions" action)
+        cache_bypass: Always query Horizon for "get"/"transactions" instead of
+            serving a fresh cached result (2s / 5s TTL)
+        account_ids: Stellar public keys (required only for "fund_many")
+        cursor: Paging token to continue "transactions" from (older records);
+            "next" resumes after the last page returned for account_id
     
     Returns:
         Action-specific response dict
     """
+    handler = _ACCOUNT_ACTIONS.get(action)
+    if handler is None:
+        return {
+            "error": f"Unknown action: {action}",
+            "valid_actions": list(_ACCOUNT_ACTIONS)
+        }
+    params = {
+        "key_manager": key_manager,
+        "horizon": horizon,
+        "account_id": account_id,
+        "secret_key": secret_key,
+        "limit": limit,
+        "cache_bypass": cache_bypass,
+        "account_ids": account_ids,
+        "cursor": cursor
+    }
+    required = _ACCOUNT_REQUIRED.get(action)
+    if required and not params[required]:
+        return {"error": f"{required} required for '{action}' action"}
+
     try:
-        if action == "create":
-            keypair = Keypair.random()
-            account_id = keypair.public_key
-            key_manager.store(account_id, keypair.secret)
-            return {
-                "account_id": account_id,
-                "message": "Account created (unfunded). Use action='fund' to activate."
-            }
-        
-        elif action == "fund":
-            if not account_id:
-                return {"error": "account_id required for 'fund' action"}
-            
-            response = requests.get(f"{FRIENDBOT_URL}?addr={account_id}", timeout=10)
-            response.raise_for_status()
-            
-            account = horizon.accounts().account_id(account_id).call()
-            xlm_balance = next(
-                (b["balance"] for b in account["balances"] if b["asset_type"] == "native"),
-                "0"
-            )
-            
-            return {
-                "success": True,
-                "balance": xlm_balance,
-                "message": "Account funded successfully with testnet XLM"
-            }
-        
-        elif action == "get":
-            if not account_id:
-                return {"error": "account_id required for 'get' action"}
-            
-            account = horizon.accounts().account_id(account_id).call()
-            return {
-                "account_id": account_id,
-                "sequence": account["sequence"],
-                "balances": account["balances"],
-                "signers": account["signers"],
-                "thresholds": account["thresholds"],
-                "flags": account.get("flags", {})
-            }
-        
-        elif action == "transactions":
-            if not account_id:
-                return {"error": "account_id required for 'transactions' action"}
-            
-            transactions = (
-                horizon.transactions()
-                .for_account(account_id)
-                .limit(limit)
-                .order(desc=True)
-                .call()
-            )
-            
-            return {
-                "transactions": [
-                    {
-                        "hash": tx["hash"],
-                        "ledger": tx["ledger"],
-                        "created_at": tx["created_at"],
-                        "source_account": tx["source_account"],
-                        "fee_charged": tx["fee_charged"],
-                        "operation_count": tx["operation_count"],
-                        "successful": tx["successful"]
-                    }
-                    for tx in transactions["_embedded"]["records"]
-                ]
-            }
-        
-        elif action == "list":
-            accounts = key_manager.list_accounts()
-            return {
-                "accounts": accounts,
-                "count": len(accounts)
-            }
-        
-        elif action == "export":
-            if not account_id:
-                return {"error": "account_id required for 'export' action"}
-            
-            secret_key = key_manager.export_secret(account_id)
-            return {
-                "account_id": account_id,
-                "secret_key": secret_key,
-                "warning": "Keep this secret key secure! Anyone with this key can control your account."
-            }
-        
-        elif action == "import":
-            if not secret_key:
-                return {"error": "secret_key required for 'import' action"}
-            
-            account_id = key_manager.import_keypair(secret_key)
-            return {
-                "account_id": account_id,
-                "message": "Keypair imported successfully"
-            }
-        
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "valid_actions": ["create", "fund", "get", "transactions", "list", "export", "import"]
-            }
-    
+        return await handler(**params)
     except Exception as e:
         return {"error": str(e)}
 
 
+async def _account_create(key_manager: KeyManager, **_) -> Dict[str, Any]:
+    """Generate and store a new (unfunded) keypair"""
+    keypair = Keypair.random()
+    account_id = keypair.public_key
+    key_manager.store(account_id, keypair.secret)
+    return {
+        "account_id": account_id,
+        "message": "Account created (unfunded). Use action='fund' to activate."
+    }
+
+
+async def _account_fund(horizon: ServerAsync, account_id: str, **_) -> Dict[str, Any]:
+    """Fund account_id via Friendbot and report its XLM balance"""
+    # Reuse the Horizon client's pooled aiohttp session (keep-alive, retries
+    # on 429/5xx) rather than a blocking request on a worker thread
+    response = await horizon._client.get(FRIENDBOT_URL, params={"addr": account_id})
+    if not 200 <= response.status_code < 300:
+        return {"success": False, "error": response.text[:512], "status": response.status_code}
+    _invalidate_account_reads(horizon, account_id)
+
+    account = await horizon.accounts().account_id(account_id).call()
+    xlm_balance = next(
+        (b["balance"] for b in account["balances"] if b["asset_type"] == "native"),
+        "0"
+    )
+
+    return {
+        "success": True,
+        "balance": xlm_balance,
+        "message": "Account funded successfully with testnet XLM"
+    }
+
+
+async def _account_fund_many(horizon: ServerAsync, account_ids: List[str], **_) -> Dict[str, Any]:
+    """Fund several accounts concurrently (total time ~ slowest, not the sum)"""
+    semaphore = asyncio.Semaphore(_FRIENDBOT_CONCURRENCY)
+
+    async def fund(account_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await _account_fund(horizon, account_id)
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+    results = await asyncio.gather(*(fund(account_id) for account_id in account_ids))
+    return {
+        "results": dict(zip(account_ids, results)),
+        "funded": sum(1 for result in results if result.get("success")),
+        "count": len(account_ids)
+    }
+
+
+async def _account_get(horizon: ServerAsync, account_id: str, cache_bypass: bool, **_) -> Dict[str, Any]:
+    """Account details (balances, sequence, signers, ...)"""
+    cache_key = (horizon.horizon_url, account_id)
+    if not cache_bypass:
+        cached = _account_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    account = await horizon.accounts().account_id(account_id).call()
+    result = {
+        "account_id": account_id,
+        "sequence": account["sequence"],
+        "balances": account["balances"],
+        "balances_by_asset": {_balance_key(b): b for b in account["balances"]},
+        "signers": account["signers"],
+        "thresholds": account["thresholds"],
+        "flags": account.get("flags", {})
+    }
+    _account_cache.set(cache_key, result)
+    return result
+
+
+def _balance_key(balance: Dict[str, Any]) -> str:
+    """balances_by_asset key: "XLM", "CODE:ISSUER", or a liquidity pool id"""
+    asset_type = balance["asset_type"]
+    if asset_type == "native":
+        return "XLM"
+    if asset_type == "liquidity_pool_shares":
+        return balance["liquidity_pool_id"]
+    return f"{balance['asset_code']}:{balance['asset_issuer']}"
+
+
+async def _account_transactions(
+    horizon: ServerAsync, account_id: str, limit: int, cache_bypass: bool,
+    cursor: Optional[str], **_
+) -> Dict[str, Any]:
+    """Successful transactions for account_id, newest first, one page at a time"""
+    cursor_key = (horizon.horizon_url, account_id)
+    if cursor == "next":
+        cursor = _tx_cursors.get(cursor_key)
+        if cursor is None:
+            return {"transactions": [], "cursor": None}
+
+    # Only the head page is cached. Keyed per account (not per limit) so a
+    # write can invalidate it; the entry holds (limit, result) and only
+    # serves the same limit
+    if cursor is None and not cache_bypass:
+        cached = _transactions_cache.get(cursor_key)
+        if cached is not None and cached[0] == limit:
+            result = cached[1]
+            if result["cursor"] is not None:
+                _tx_cursors[cursor_key] = result["cursor"]
+            return result
+
+    builder = (
+        horizon.transactions()
+        .for_account(account_id)
+        .include_failed(False)
+        .limit(limit)
+        .order(desc=True)
+    )
+    if cursor is not None:
+        builder = builder.cursor(cursor)
+    records = (await builder.call())["_embedded"]["records"]
+
+    next_cursor = records[-1]["paging_token"] if records else None
+    if next_cursor is not None:
+        _tx_cursors[cursor_key] = next_cursor
+    else:
+        _tx_cursors.pop(cursor_key, None)
+
+    result = {
+        "transactions": [dict(zip(_TX_FIELDS, _tx_columns(tx))) for tx in records],
+        "cursor": next_cursor
+    }
+    if cursor is None:
+        _transactions_cache.set(cursor_key, (limit, result))
+    return result
+
+
+# (horizon_url, account_id) -> paging token after the last transactions page
+# served, so cursor="next" continues without re-fetching the head
+_tx_cursors: Dict[tuple, str] = {}
+
+
+async def _account_list(key_manager: KeyManager, **_) -> Dict[str, Any]:
+    """All managed account ids"""
+    accounts = key_manager.list_accounts()
+    return {
+        "accounts": accounts,
+        "count": len(accounts)
+    }
+
+
+async def _account_export(key_manager: KeyManager, account_id: str, **_) -> Dict[str, Any]:
+    """Export the stored secret key for account_id"""
+    secret_key = key_manager.export_secret(account_id)
+    return {
+        "account_id": account_id,
+        "secret_key": secret_key,
+        "warning": "Keep this secret key secure! Anyone with this key can control your account."
+    }
+
+
+async def _account_import(key_manager: KeyManager, secret_key: str, **_) -> Dict[str, Any]:
+    """Store an existing secret key"""
+    account_id = key_manager.import_keypair(secret_key)
+    return {
+        "account_id": account_id,
+        "message": "Keypair imported successfully"
+    }
+
+
+# account_manager dispatch table (insertion order is the advertised action order)
+_ACCOUNT_ACTIONS = {
+    "create": _account_create,
+    "fund": _account_fund,
+    "fund_many": _account_fund_many,
+    "get": _account_get,
+    "transactions": _account_transactions,
+    "list": _account_list,
+    "export": _account_export,
+    "import": _account_import,
+}
+# Argument each action cannot run without, checked before dispatch
+_ACCOUNT_REQUIRED = {
+    "fund": "account_id",
+    "fund_many": "account_ids",
+    "get": "account_id",
+    "transactions": "account_id",
+    "export": "account_id",
+    "import": "secret_key",
+}
+
+
 # ============================================================================
 # COMPOSITE TOOL 2: TRADING
 # ============================================================================
 
-def trading(
+async def trading(
     action: str,
     account_id: str,
     key_manager: KeyManager,
-    horizon: Server,
+    horizon: ServerAsync,
     buying_asset: Optional[str] = None,
     selling_asset: Optional[str] = None,
     buying_issuer: Optional[str] = None,
@@ -390,7 +857,10 @@ def trading(
     order_type: str = "limit",
     offer_id: Optional[str] = None,
     max_slippage: float = 0.05,
-    auto_sign: bool = True
+    auto_sign: bool = True,
+    asynchronous: bool = False,
+    offer_ids: Optional[List[str]] = None,
+    offer: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Unified SDEX trading tool with intuitive buying/selling semantics.
@@ -399,10 +869,11 @@ def trading(
         - "buy": Acquire buying_asset by spending selling_asset
         - "sell": Give up selling_asset to acquire buying_asset
         - "cancel_order": Cancel an open order
+        - "cancel_orders": Cancel several (or all) open orders in one transaction
         - "get_orders": Get all open orders
 
     Args:
-        action: Trading operation ("buy", "sell", "cancel_order", "get_orders")
+        action: Trading operation ("buy", "sell", "cancel_order", "cancel_orders", "get_orders")
         account_id: Stellar public key
         key_manager: KeyManager instance
         horizon: Horizon server instance
@@ -416,6 +887,11 @@ def trading(
         offer_id: Offer ID (for cancel_order action)
         max_slippage: Maximum slippage tolerance for market orders (default: 0.05 = 5%)
         auto_sign: Auto-sign and submit (default: True)
+        asynchronous: Return a pending ticket without waiting for the ledger
+            (default: False); poll with utilities(action="tx_status")
+        offer_ids: Offer IDs for cancel_orders (default: all open orders)
+        offer: Offer record from get_orders for cancel_order (instead of
+            offer_id); skips looking the offer up on Horizon
 
     Returns:
         {"success": bool, "hash": "...", "ledger": 123, "market_execution": {...}}
@@ -433,183 +909,343 @@ def trading(
         trading(action="sell", selling_asset="XLM", buying_asset="USDC",
                 amount="100", price="0.01", order_type="limit", ...)
     """
+    handler = _TRADING_ACTIONS.get(action)
+    if handler is None:
+        return {
+            "error": f"Unknown action: {action}",
+            "valid_actions": list(_TRADING_ACTIONS)
+        }
+    if action == "cancel_order" and not offer_id and not offer:
+        return {"error": "offer_id (or offer) required for 'cancel_order' action"}
+
     try:
-        if action == "get_orders":
-            # Get open orders
-            offers = horizon.offers().for_account(account_id).call()
-            return {
-                "offers": [
-                    {
-                        "id": offer["id"],
-                        "selling": offer["selling"],
-                        "buying": offer["buying"],
-                        "amount": offer["amount"],
-                        "price": offer["price"],
-                        "last_modified_ledger": offer["last_modified_ledger"]
-                    }
-                    for offer in offers["_embedded"]["records"]
-                ],
-                "count": len(offers["_embedded"]["records"])
-            }
+        return await handler(
+            action=action,
+            account_id=account_id,
+            key_manager=key_manager,
+            horizon=horizon,
+            buying_asset=buying_asset,
+            selling_asset=selling_asset,
+            buying_issuer=buying_issuer,
+            selling_issuer=selling_issuer,
+            amount=amount,
+            price=price,
+            order_type=order_type,
+            offer_id=offer_id,
+            max_slippage=max_slippage,
+            auto_sign=auto_sign,
+            asynchronous=asynchronous,
+            offer_ids=offer_ids,
+            offer=offer
+        )
+    except Exception as e:
+        return {"error": str(e)}
 
-        elif action == "cancel_order":
-            if not offer_id:
-                return {"error": "offer_id required for 'cancel_order' action"}
-
-            # Get offer details
-            offer = horizon.offers().offer(offer_id).call()
-
-            selling = Asset(offer["selling"]["asset_code"], offer["selling"]["asset_issuer"]) \
-                if offer["selling"]["asset_type"] != "native" else Asset.native()
-            buying = Asset(offer["buying"]["asset_code"], offer["buying"]["asset_issuer"]) \
-                if offer["buying"]["asset_type"] != "native" else Asset.native()
-
-            def cancel_op(builder):
-                builder.append_manage_sell_offer_op(
-                    selling=selling,
-                    buying=buying,
-                    amount="0",
-                    price=offer["price"],
-                    offer_id=int(offer_id)
-                )
 
-            result = _build_sign_submit(account_id, [cancel_op], key_manager, horizon, auto_sign)
-            if result.get("success"):
-                result["message"] = f"Order {offer_id} cancelled successfully"
-            return result
+async def _get_orders(account_id: str, horizon: ServerAsync, **_) -> Dict[str, Any]:
+    """List the account's open offers"""
+    records = await _open_offers(horizon, account_id)
+    return {
+        "offers": [dict(zip(_OFFER_FIELDS, _offer_columns(offer))) for offer in records],
+        "count": len(records)
+    }
 
-        elif action in ["buy", "sell"]:
-            # Validate inputs
-            if not buying_asset or not selling_asset:
-                return {"error": "Both buying_asset and selling_asset required for trading"}
-            if not amount:
-                return {"error": "amount required for trading"}
-            if order_type == "limit" and not price:
-                return {"error": "price required for limit orders"}
-
-            # Build asset objects
-            buying = _dict_to_asset(buying_asset, buying_issuer)
-            selling = _dict_to_asset(selling_asset, selling_issuer)
-
-            # Determine orderbook orientation for market orders
-            # Convention: XLM is base when paired with issued assets
-            if order_type == "market":
-                # Determine base and quote for orderbook query
-                if selling_asset.upper() == "XLM":
-                    base_asset = selling_asset
-                    quote_asset = buying_asset
-                    quote_issuer_val = buying_issuer
-                    # User wants to buy quote (buying_asset) by selling base (selling_asset)
-                    orderbook_side = "buy"
-                elif buying_asset.upper() == "XLM":
-                    base_asset = buying_asset
-                    quote_asset = selling_asset
-                    quote_issuer_val = selling_issuer
-                    # User wants to sell quote (selling_asset) to get base (buying_asset)
-                    orderbook_side = "sell"
-                else:
-                    # Both are issued assets - use alphabetical order
-                    if buying_asset < selling_asset:
-                        base_asset = buying_asset
-                        quote_asset = selling_asset
-                        quote_issuer_val = selling_issuer
-                        orderbook_side = "sell"
-                    else:
-                        base_asset = selling_asset
-                        quote_asset = buying_asset
-                        quote_issuer_val = buying_issuer
-                        orderbook_side = "buy"
-
-                # STEP 1: Query orderbook
-                orderbook_result = market_data(
-                    action="orderbook",
-                    horizon=horizon,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    quote_issuer=quote_issuer_val,
-                    limit=20
-                )
 
-                if "error" in orderbook_result:
-                    return {"error": f"Failed to fetch orderbook: {orderbook_result['error']}"}
+async def _cancel_order(
+    account_id: str,
+    key_manager: KeyManager,
+    horizon: ServerAsync,
+    offer_id: Optional[str],
+    offer: Optional[Dict[str, Any]],
+    auto_sign: bool,
+    asynchronous: bool,
+    **_
+) -> Dict[str, Any]:
+    """Cancel an open offer (a manage_sell_offer with amount 0)"""
+    if offer is not None:
+        # Caller already holds the record (e.g. from get_orders): no lookup
+        if offer_id and str(offer_id) != str(offer["id"]):
+            return {"error": f"offer is for offer_id {offer['id']}, not {offer_id}"}
+        offer_id = str(offer["id"])
+        account = await _load_source_account(account_id, horizon)
+    else:
+        # Offer details and the source account are independent reads: overlap them
+        offer, account = await asyncio.gather(
+            _load_offer(horizon, offer_id),
+            _load_source_account(account_id, horizon)
+        )
 
-                # STEP 2: Calculate fill strategy
-                fill_calc = _calculate_market_fill(
-                    orderbook=orderbook_result,
-                    amount=amount,
-                    side=orderbook_side,
-                    max_slippage=max_slippage
-                )
+    selling = _horizon_asset(offer["selling"])
+    buying = _horizon_asset(offer["buying"])
 
-                if not fill_calc.get("feasible"):
-                    return {
-                        "success": False,
-                        "error": fill_calc.get("error"),
-                        "market_data": fill_calc
-                    }
+    def cancel_op(builder):
+        builder.append_manage_sell_offer_op(
+            selling=selling,
+            buying=buying,
+            amount="0",
+            price=offer["price"],
+            offer_id=int(offer_id)
+        )
 
-                price_value = fill_calc["execution_price"]
-            else:
-                # Limit order - use user-provided price
-                price_value = price
-
-            # STEP 3: Execute transaction
-            # For action="buy": use manage_buy_offer (amount is buying_asset amount)
-            # For action="sell": use manage_sell_offer (amount is selling_asset amount)
-            def trade_op(builder):
-                if action == "buy":
-                    builder.append_manage_buy_offer_op(
-                        selling=selling,
-                        buying=buying,
-                        amount=amount,
-                        price=price_value
-                    )
-                else:  # action == "sell"
-                    builder.append_manage_sell_offer_op(
-                        selling=selling,
-                        buying=buying,
-                        amount=amount,
-                        price=price_value
-                    )
-
-            result = _build_sign_submit(account_id, [trade_op], key_manager, horizon, auto_sign)
-
-            # Add market execution details for market orders
-            if result.get("success") and order_type == "market":
-                result["market_execution"] = {
-                    "requested_amount": amount,
-                    "expected_average_price": fill_calc["average_price"],
-                    "best_price": fill_calc["best_price"],
-                    "execution_price": fill_calc["execution_price"],
-                    "slippage": fill_calc["slippage"],
-                    "total_cost_estimate": fill_calc["total_cost"],
-                    "fills": fill_calc["fills"]
-                }
+    result = await _build_sign_submit(
+        account_id, [cancel_op], key_manager, horizon, auto_sign,
+        account=account, asynchronous=asynchronous
+    )
+    if result.get("success"):
+        _offer_cache.pop((horizon.horizon_url, str(offer_id)))
+        if not result.get("pending"):
+            result["message"] = f"Order {offer_id} cancelled successfully"
+    return result
 
-            return result
 
+async def _cancel_orders(
+    account_id: str,
+    key_manager: KeyManager,
+    horizon: ServerAsync,
+    offer_ids: Optional[List[str]],
+    auto_sign: bool,
+    asynchronous: bool,
+    **_
+) -> Dict[str, Any]:
+    """Cancel offer_ids (or every open offer) with one multi-op transaction"""
+    if offer_ids and len(offer_ids) > _MAX_OPS_PER_TX:
+        return {"error": f"At most {_MAX_OPS_PER_TX} offers can be cancelled per transaction"}
+
+    # One open-offers listing serves both cases; with offer_ids it also proves
+    # every id is an open offer of account_id
+    offers, account = await asyncio.gather(
+        _open_offers(horizon, account_id, None if offer_ids else _MAX_OPS_PER_TX),
+        _load_source_account(account_id, horizon)
+    )
+    if offer_ids:
+        by_id = {str(offer["id"]): offer for offer in offers}
+        unknown = [str(offer_id) for offer_id in offer_ids if str(offer_id) not in by_id]
+        if unknown:
+            return {"error": f"Not open offers of {account_id}: {', '.join(unknown)}"}
+        offers = [by_id[offer_id] for offer_id in dict.fromkeys(map(str, offer_ids))]
+    if not offers:
+        return {"success": True, "cancelled": [], "message": "No open orders to cancel"}
+
+    def cancel_op(offer):
+        selling = _horizon_asset(offer["selling"])
+        buying = _horizon_asset(offer["buying"])
+
+        def op(builder):
+            builder.append_manage_sell_offer_op(
+                selling=selling,
+                buying=buying,
+                amount="0",
+                price=offer["price"],
+                offer_id=int(offer["id"])
+            )
+        return op
+
+    result = await _build_sign_submit(
+        account_id, [cancel_op(offer) for offer in offers], key_manager, horizon, auto_sign,
+        account=account, asynchronous=asynchronous
+    )
+    if result.get("success"):
+        cancelled = [str(offer["id"]) for offer in offers]
+        for offer_id in cancelled:
+            _offer_cache.pop((horizon.horizon_url, offer_id))
+        result["cancelled"] = cancelled
+        if not result.get("pending"):
+            result["message"] = f"Cancelled {len(cancelled)} order(s) successfully"
+        if not offer_ids and len(offers) == _MAX_OPS_PER_TX:
+            result["message"] = result["message"] + " (more may remain; call again)"
+    return result
+
+
+async def _open_offers(
+    horizon: ServerAsync, account_id: str, limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    The account's open offer records, up to limit (None for all)
+
+    Pages are requested at Horizon's maximum size and followed by cursor.
+    Offer paging tokens are offer ids, not positions, so there is no way to
+    address later pages before the previous one arrives. Records are also
+    stored in the offer cache.
+    """
+    records = []
+    cursor = None
+    while True:
+        page_size = _OFFERS_PAGE_SIZE if limit is None else min(limit - len(records), _OFFERS_PAGE_SIZE)
+        builder = horizon.offers().for_account(account_id).limit(page_size)
+        if cursor is not None:
+            builder = builder.cursor(cursor)
+        page = (await builder.call())["_embedded"]["records"]
+        records.extend(page)
+        if len(page) < page_size or len(records) == limit:
+            break
+        cursor = page[-1]["paging_token"]
+
+    for offer in records:
+        _offer_cache.set((horizon.horizon_url, str(offer["id"])), offer)
+    return records
+
+
+async def _load_offer(horizon: ServerAsync, offer_id: str) -> Dict[str, Any]:
+    """Offer record for offer_id, from the short-TTL cache when recently seen"""
+    cache_key = (horizon.horizon_url, str(offer_id))
+    offer = _offer_cache.get(cache_key)
+    if offer is None:
+        offer = await horizon.offers().offer(offer_id).call()
+        _offer_cache.set(cache_key, offer)
+    return offer
+
+
+async def _place_order(
+    action: str,
+    account_id: str,
+    key_manager: KeyManager,
+    horizon: ServerAsync,
+    buying_asset: Optional[str],
+    selling_asset: Optional[str],
+    buying_issuer: Optional[str],
+    selling_issuer: Optional[str],
+    amount: Optional[str],
+    price: Optional[str],
+    order_type: str,
+    max_slippage: float,
+    auto_sign: bool,
+    asynchronous: bool,
+    **_
+) -> Dict[str, Any]:
+    """Place a buy/sell limit or market order"""
+    # Validate inputs
+    if not buying_asset or not selling_asset:
+        return {"error": "Both buying_asset and selling_asset required for trading"}
+    if not amount:
+        return {"error": "amount required for trading"}
+    if order_type == "limit" and not price:
+        return {"error": "price required for limit orders"}
+
+    # Build asset objects
+    buying = _dict_to_asset(buying_asset, buying_issuer)
+    selling = _dict_to_asset(selling_asset, selling_issuer)
+
+    # Determine orderbook orientation for market orders
+    # Convention: XLM is base when paired with issued assets
+    if order_type == "market":
+        # Determine base and quote for orderbook query
+        if selling_asset.upper() == "XLM":
+            base_asset = selling_asset
+            quote_asset = buying_asset
+            quote_issuer_val = buying_issuer
+            # User wants to buy quote (buying_asset) by selling base (selling_asset)
+            orderbook_side = "buy"
+        elif buying_asset.upper() == "XLM":
+            base_asset = buying_asset
+            quote_asset = selling_asset
+            quote_issuer_val = selling_issuer
+            # User wants to sell quote (selling_asset) to get base (buying_asset)
+            orderbook_side = "sell"
         else:
+            # Both are issued assets - use alphabetical order
+            if buying_asset < selling_asset:
+                base_asset = buying_asset
+                quote_asset = selling_asset
+                quote_issuer_val = selling_issuer
+                orderbook_side = "sell"
+            else:
+                base_asset = selling_asset
+                quote_asset = buying_asset
+                quote_issuer_val = buying_issuer
+                orderbook_side = "buy"
+
+        # STEP 1: Query orderbook, loading the source account concurrently
+        # (both are independent Horizon reads, so overlap the round-trips;
+        # the account load is skipped when its sequence is cached)
+        orderbook_result, account = await asyncio.gather(
+            market_data(
+                action="orderbook",
+                horizon=horizon,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                quote_issuer=quote_issuer_val,
+                limit=20,
+                cache_bypass=True  # price the order off a fresh book
+            ),
+            _load_source_account(account_id, horizon)
+        )
+
+        if "error" in orderbook_result:
+            return {"error": f"Failed to fetch orderbook: {orderbook_result['error']}"}
+
+        # STEP 2: Calculate fill strategy
+        fill_calc = _calculate_market_fill(
+            orderbook=orderbook_result,
+            amount=amount,
+            side=orderbook_side,
+            max_slippage=max_slippage
+        )
+
+        if not fill_calc.get("feasible"):
             return {
-                "error": f"Unknown action: {action}",
-                "valid_actions": ["buy", "sell", "cancel_order", "get_orders"]
+                "success": False,
+                "error": fill_calc.get("error"),
+                "market_data": fill_calc
             }
-    
-    except Exception as e:
-        return {"error": str(e)}
+
+        price_value = fill_calc["execution_price"]
+    else:
+        # Limit order - use user-provided price
+        price_value = price
+        account = None
+
+    # STEP 3: Execute transaction
+    append_offer_op = _ORDER_OPS[action]
+
+    def trade_op(builder):
+        append_offer_op(builder, selling=selling, buying=buying, amount=amount, price=price_value)
+
+    result = await _build_sign_submit(
+        account_id, [trade_op], key_manager, horizon, auto_sign,
+        account=account, asynchronous=asynchronous
+    )
+
+    # Add market execution details for market orders
+    if result.get("success") and order_type == "market":
+        result["market_execution"] = {
+            "requested_amount": amount,
+            "expected_average_price": fill_calc["average_price"],
+            "best_price": fill_calc["best_price"],
+            "execution_price": fill_calc["execution_price"],
+            "slippage": fill_calc["slippage"],
+            "total_cost_estimate": fill_calc["total_cost"],
+            "fills": fill_calc["fills"]
+        }
+
+    return result
+
+
+# trading dispatch table (insertion order is the advertised action order)
+_TRADING_ACTIONS = {
+    "buy": _place_order,
+    "sell": _place_order,
+    "cancel_order": _cancel_order,
+    "cancel_orders": _cancel_orders,
+    "get_orders": _get_orders,
+}
 
 
 # ============================================================================
 # COMPOSITE TOOL 3: TRUSTLINE MANAGER
 # ============================================================================
 
-def trustline_manager(
+_TRUSTLINE_ACTIONS = ("establish", "remove")
+
+
+async def trustline_manager(
     action: str,
     account_id: str,
     asset_code: str,
     asset_issuer: str,
     key_manager: KeyManager,
-    horizon: Server,
-    limit: Optional[str] = None
+    horizon: ServerAsync,
+    limit: Optional[str] = None,
+    asynchronous: bool = False
 ) -> Dict[str, Any]:
     """
     Manage trustlines for issued assets.
@@ -626,24 +1262,31 @@ def trustline_manager(
         key_manager: KeyManager instance
         horizon: Horizon server instance
         limit: Optional trust limit (default: maximum)
+        asynchronous: Return a pending ticket without waiting for the ledger
+            (default: False); poll with utilities(action="tx_status")
     
     Returns:
         {"success": bool, "hash": "...", "message": "..."}
     """
+    if action not in _TRUSTLINE_ACTIONS:
+        return {
+            "error": f"Unknown action: {action}",
+            "valid_actions": list(_TRUSTLINE_ACTIONS)
+        }
+    # "remove" is a change_trust with limit 0
+    trust_limit = limit if action == "establish" else "0"
+
     try:
         asset = Asset(asset_code, asset_issuer)
         
         def trustline_op(builder):
-            if action == "establish":
-                builder.append_change_trust_op(asset=asset, limit=limit)
-            elif action == "remove":
-                builder.append_change_trust_op(asset=asset, limit="0")
-            else:
-                raise ValueError(f"Unknown action: {action}")
+            builder.append_change_trust_op(asset=asset, limit=trust_limit)
         
-        result = _build_sign_submit(account_id, [trustline_op], key_manager, horizon, auto_sign=True)
+        result = await _build_sign_submit(
+            account_id, [trustline_op], key_manager, horizon, auto_sign=True, asynchronous=asynchronous
+        )
         
-        if result.get("success"):
+        if result.get("success") and not result.get("pending"):
             result["message"] = f"Trustline {'established' if action == 'establish' else 'removed'} for {asset_code}"
         
         return result
@@ -656,19 +1299,22 @@ def trustline_manager(
 # COMPOSITE TOOL 4: MARKET DATA
 # ============================================================================
 
-def market_data(
+async def market_data(
     action: str,
-    horizon: Server,
+    horizon: ServerAsync,
     base_asset: str = "XLM",
     quote_asset: Optional[str] = None,
     quote_issuer: Optional[str] = None,
-    limit: int = 20
+    limit: int = 20,
+    cache_bypass: bool = False,
+    pairs: Optional[List[Dict[str, str]]] = None
 ) -> Dict[str, Any]:
     """
     Query SDEX market data.
     
     Actions:
         - "orderbook": Get orderbook for asset pair
+        - "orderbooks": Get orderbooks for several pairs concurrently
     
     Args:
         action: Market data query type
@@ -677,80 +1323,358 @@ def market_data(
         quote_asset: Quote asset code
         quote_issuer: Quote asset issuer (if not XLM)
         limit: Number of results (default: 20)
+        cache_bypass: Always query Horizon instead of the short-TTL cache
+        pairs: Pairs for "orderbooks", each a dict with quote_asset and
+            optional quote_issuer / base_asset (default "XLM")
     
     Returns:
         Action-specific market data
     """
+    handler = _MARKET_DATA_ACTIONS.get(action)
+    if handler is None:
+        return {
+            "error": f"Unknown action: {action}",
+            "valid_actions": list(_MARKET_DATA_ACTIONS)
+        }
+    params = {
+        "horizon": horizon,
+        "base_asset": base_asset,
+        "quote_asset": quote_asset,
+        "quote_issuer": quote_issuer,
+        "limit": limit,
+        "cache_bypass": cache_bypass,
+        "pairs": pairs
+    }
+    required = _MARKET_DATA_REQUIRED.get(action)
+    if required and not params[required]:
+        return {"error": f"{required} required for '{action}' action"}
+
     try:
-        if action == "orderbook":
-            if not quote_asset:
-                return {"error": "quote_asset required for orderbook query"}
-            
-            base = _dict_to_asset(base_asset)
-            quote = _dict_to_asset(quote_asset, quote_issuer)
-            
-            orderbook = horizon.orderbook(base, quote).limit(limit).call()
-            return {
-                "bids": orderbook["bids"],
-                "asks": orderbook["asks"],
-                "base": orderbook["base"],
-                "counter": orderbook["counter"]
-            }
-        
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "valid_actions": ["orderbook"]
-            }
-    
+        return await handler(**params)
     except Exception as e:
         return {"error": str(e)}
 
 
+async def _market_orderbook(
+    horizon: ServerAsync,
+    base_asset: str,
+    quote_asset: str,
+    quote_issuer: Optional[str],
+    limit: int,
+    cache_bypass: bool,
+    **_
+) -> Dict[str, Any]:
+    """Orderbook for one pair"""
+    return await _orderbook(horizon, base_asset, quote_asset, quote_issuer, limit, cache_bypass)
+
+
+async def _market_orderbooks(
+    horizon: ServerAsync,
+    pairs: List[Dict[str, str]],
+    limit: int,
+    cache_bypass: bool,
+    **_
+) -> Dict[str, Any]:
+    """Orderbooks for several pairs, fetched concurrently (per-pair errors inline)"""
+    if not all(pair.get("quote_asset") for pair in pairs):
+        return {"error": "every pair needs a quote_asset"}
+
+    semaphore = asyncio.Semaphore(_ORDERBOOK_CONCURRENCY)
+
+    async def fetch(pair: Dict[str, str]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await _orderbook(
+                    horizon, pair.get("base_asset", "XLM"), pair["quote_asset"],
+                    pair.get("quote_issuer"), limit, cache_bypass
+                )
+            except Exception as e:
+                return {"error": str(e)}
+
+    return {"orderbooks": await asyncio.gather(*(fetch(pair) for pair in pairs))}
+
+
+# market_data dispatch table (insertion order is the advertised action order)
+_MARKET_DATA_ACTIONS = {
+    "orderbook": _market_orderbook,
+    "orderbooks": _market_orderbooks,
+}
+# Argument each action cannot run without, checked before dispatch
+_MARKET_DATA_REQUIRED = {
+    "orderbook": "quote_asset",
+    "orderbooks": "pairs",
+}
+
+
+async def _orderbook(
+    horizon: ServerAsync,
+    base_asset: str,
+    quote_asset: str,
+    quote_issuer: Optional[str],
+    limit: int,
+    cache_bypass: bool
+) -> Dict[str, Any]:
+    """Orderbook for one pair, served from the short-TTL cache when fresh"""
+    cache_key = (horizon.horizon_url, base_asset, quote_asset, quote_issuer, limit)
+    if not cache_bypass:
+        cached = _streamed_orderbooks.get(cache_key) or _orderbook_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    base = _dict_to_asset(base_asset)
+    quote = _dict_to_asset(quote_asset, quote_issuer)
+
+    orderbook = await horizon.orderbook(base, quote).limit(limit).call()
+    result = _orderbook_summary(orderbook)
+    _orderbook_cache.set(cache_key, result)
+    return result
+
+
+def _orderbook_summary(orderbook: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields market_data returns from a Horizon orderbook record"""
+    return {
+        "bids": orderbook["bids"],
+        "asks": orderbook["asks"],
+        "base": orderbook["base"],
+        "counter": orderbook["counter"]
+    }
+
+
+async def stream_orderbook(
+    horizon: ServerAsync,
+    base_asset: str,
+    quote_asset: str,
+    quote_issuer: Optional[str] = None,
+    limit: int = 20,
+    callback: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> None:
+    """
+    Follow a pair's orderbook over Horizon's SSE stream until cancelled
+
+    While this runs, market_data(action="orderbook") for the same pair and
+    limit is answered from the latest pushed snapshot with no HTTP request.
+    The stream runs on the shared aiohttp client for horizon's URL, so it
+    works with HTTP2 enabled too.
+
+    Args:
+        horizon: Horizon server instance
+        base_asset: Base asset code
+        quote_asset: Quote asset code
+        quote_issuer: Quote asset issuer (if not XLM)
+        limit: Orders per side
+        callback: Called with each new snapshot ({"bids", "asks", ...})
+    """
+    cache_key = (horizon.horizon_url, base_asset, quote_asset, quote_issuer, limit)
+    base = _dict_to_asset(base_asset)
+    quote = _dict_to_asset(quote_asset, quote_issuer)
+    try:
+        stream = clients.horizon_stream(horizon.horizon_url).orderbook(base, quote).limit(limit).stream()
+        async for orderbook in stream:
+            result = _orderbook_summary(orderbook)
+            _streamed_orderbooks[cache_key] = result
+            if callback is not None:
+                callback(result)
+    finally:
+        _streamed_orderbooks.pop(cache_key, None)
+
+
+async def stream_open_orders(
+    horizon: ServerAsync,
+    account_id: str,
+    callback: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> None:
+    """
+    Follow changes to an account's offers over Horizon's SSE stream until cancelled
+
+    Each changed offer record refreshes the offer cache (so cancel_order
+    skips its lookup) and is passed to callback. Like stream_orderbook, the
+    stream runs on the shared aiohttp client for horizon's URL.
+
+    Args:
+        horizon: Horizon server instance
+        account_id: Stellar public key
+        callback: Called with each created/updated offer record
+    """
+    stream = clients.horizon_stream(horizon.horizon_url).offers().for_account(account_id).cursor("now").stream()
+    async for offer in stream:
+        _offer_cache.set((horizon.horizon_url, str(offer["id"])), offer)
+        if callback is not None:
+            callback(offer)
+
+
+async def _tx_status(tx_hash: str, horizon: ServerAsync) -> Dict[str, Any]:
+    """Report an asynchronous submit's outcome, falling back to Horizon's record"""
+    pending = _pending_submits.get(tx_hash)
+    if pending is None:
+        # Not submitted from this process (or already reported): ask Horizon
+        tx = await horizon.transactions().transaction(tx_hash).call()
+        return {
+            "status": "confirmed" if tx.get("successful") else "failed",
+            "success": tx.get("successful", False),
+            "hash": tx_hash,
+            "ledger": tx.get("ledger")
+        }
+    task = pending.task
+    if not task.done():
+        return {
+            "status": "pending",
+            "hash": tx_hash,
+            "elapsed": round(time.monotonic() - pending.submitted_at, 3)
+        }
+
+    del _pending_submits[tx_hash]
+    if task.exception() is not None:
+        return {"status": "failed", "success": False, "hash": tx_hash, "error": str(task.exception())}
+    response = task.result()
+    return {
+        "status": "confirmed" if response.get("successful") else "failed",
+        "success": response.get("successful", False),
+        "hash": tx_hash,
+        "ledger": response.get("ledger")
+    }
+
+
 # ============================================================================
 # COMPOSITE TOOL 5: UTILITIES
 # ============================================================================
 
-def utilities(action: str, horizon: Server) -> Dict[str, Any]:
+async def utilities(
+    action: str,
+    horizon: ServerAsync,
+    tx_hash: Optional[str] = None,
+    signed_xdr: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Network utilities and server information.
     
     Actions:
         - "status": Get Horizon server status
         - "fee": Estimate current transaction fee
+        - "tx_status": Outcome of a transaction submitted with asynchronous=True
+        - "submit": Submit a transaction signed outside this server
     
     Args:
         action: Utility operation
         horizon: Horizon server instance
+        tx_hash: Transaction hash (for tx_status action)
+        signed_xdr: Signed transaction envelope XDR (for submit action)
     
     Returns:
-        Action-specific utility data
+        Action-specific utility data (status/fee served from a 5s cache when fresh)
     """
+    handler = _UTILITY_ACTIONS.get(action)
+    if handler is None:
+        return {
+            "error": f"Unknown action: {action}",
+            "valid_actions": list(_UTILITY_ACTIONS)
+        }
+    params = {
+        "horizon": horizon,
+        "tx_hash": tx_hash,
+        "signed_xdr": signed_xdr
+    }
+    required = _UTILITY_REQUIRED.get(action)
+    if required and not params[required]:
+        return {"error": f"{required} required for '{action}' action"}
+
     try:
-        if action == "status":
-            root = horizon.root().call()
-            return {
-                "horizon_version": root.get("horizon_version"),
-                "core_version": root.get("core_version"),
-                "history_latest_ledger": root.get("history_latest_ledger"),
-                "network_passphrase": root.get("network_passphrase")
-            }
-        
-        elif action == "fee":
-            fee_stats = horizon.fee_stats().call()
-            return {
-                "fee": fee_stats.get("last_ledger_base_fee", "100"),
-                "unit": "stroops",
-                "fee_charged_max": fee_stats.get("max_fee", {}).get("max"),
-                "fee_charged_min": fee_stats.get("min_fee", {}).get("min"),
-                "message": "Fee is dynamic. Use at least the base fee for transaction."
-            }
-        
-        else:
-            return {
-                "error": f"Unknown action: {action}",
-                "valid_actions": ["status", "fee"]
-            }
-    
+        return await handler(**params)
     except Exception as e:
         return {"error": str(e)}
+
+
+def _cached_utility(fetch: Callable) -> Callable:
+    """Wrap fetch(horizon) as a utilities handler served through the 5s cache"""
+    async def handler(horizon: ServerAsync, **_) -> Dict[str, Any]:
+        cache_key = (horizon.horizon_url, fetch)
+        cached = _utilities_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await fetch(horizon)
+        _utilities_cache.set(cache_key, result)
+        return result
+    return handler
+
+
+async def _utility_tx_status(horizon: ServerAsync, tx_hash: str, **_) -> Dict[str, Any]:
+    """Outcome of an asynchronous submit"""
+    return await _tx_status(tx_hash, horizon)
+
+
+async def _utility_submit(horizon: ServerAsync, signed_xdr: str, **_) -> Dict[str, Any]:
+    """Submit an externally signed envelope"""
+    return await _submit_signed(signed_xdr, horizon)
+
+
+async def _submit_signed(signed_xdr: str, horizon: ServerAsync) -> Dict[str, Any]:
+    """
+    POST an externally signed envelope to Horizon as-is
+
+    The envelope is decoded only for the SEP-29 memo-required check every
+    other submit path runs (no Horizon lookups when it carries a memo); the
+    original XDR is posted unchanged rather than re-encoded.
+    """
+    tx = parse_transaction_envelope_from_xdr(signed_xdr, TESTNET_NETWORK_PASSPHRASE).transaction
+    try:
+        await horizon._check_memo_required(tx)
+    except AccountRequiresMemoError as e:
+        return {"success": False, "error": f"{e} ({e.account_id})"}
+    response = await horizon._client.post(
+        urljoin_with_query(horizon.horizon_url, "transactions"), data={"tx": signed_xdr}
+    )
+    try:
+        raise_request_exception(response)
+    except BadRequestError as e:
+        result_codes = (e.extras or {}).get("result_codes")
+        return {"success": False, "error": result_codes or e.title or e.message}
+    tx = response.json()
+
+    source = tx.get("source_account")
+    if source:
+        # Consumed a sequence number this process did not reserve
+        _sequences.pop(source, None)
+        _invalidate_account_reads(horizon, source)
+    return {
+        "success": tx.get("successful", False),
+        "hash": tx.get("hash"),
+        "ledger": tx.get("ledger"),
+        "message": "Transaction submitted successfully"
+    }
+
+
+async def _server_status(horizon: ServerAsync) -> Dict[str, Any]:
+    """Horizon / Core versions and latest ledger"""
+    root = await horizon.root().call()
+    return {
+        "horizon_version": root.get("horizon_version"),
+        "core_version": root.get("core_version"),
+        "history_latest_ledger": root.get("history_latest_ledger"),
+        "network_passphrase": root.get("network_passphrase")
+    }
+
+
+async def _fee_estimate(horizon: ServerAsync) -> Dict[str, Any]:
+    """Base fee and recent fee range"""
+    fee_stats = await horizon.fee_stats().call()
+    return {
+        "fee": fee_stats.get("last_ledger_base_fee", "100"),
+        "unit": "stroops",
+        "fee_charged_max": fee_stats.get("max_fee", {}).get("max"),
+        "fee_charged_min": fee_stats.get("min_fee", {}).get("min"),
+        "message": "Fee is dynamic. Use at least the base fee for transaction."
+    }
+
+
+# utilities dispatch table (insertion order is the advertised action order);
+# status and fee are served through the 5s cache
+_UTILITY_ACTIONS = {
+    "status": _cached_utility(_server_status),
+    "fee": _cached_utility(_fee_estimate),
+    "tx_status": _utility_tx_status,
+    "submit": _utility_submit,
+}
+# Argument each action cannot run without, checked before dispatch
+_UTILITY_REQUIRED = {
+    "tx_status": "tx_hash",
+    "submit": "signed_xdr",
+}
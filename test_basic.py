@@ -4,8 +4,9 @@ Tests account creation, funding, and basic operations
 Generates markdown report
 """
 
+import asyncio
 from datetime import datetime
-from stellar_sdk import Server
+import clients
 from key_manager import KeyManager
 from stellar_tools import (
     account_manager,
@@ -18,9 +19,14 @@ HORIZON_URL = "https://horizon-testnet.stellar.org"
 USDC_ISSUER = "GBBD47IF6LWK7P7MDEVSCWR7DPUWV3NY3DTQEVFL4NAT4AQH3ZLLFLA5"
 
 # Initialize
-horizon = Server(HORIZON_URL)
+horizon = clients.horizon(HORIZON_URL)
 keys = KeyManager()
 
+# Composite tools are async; drive them all on one event loop so the
+# Horizon client's connection pool stays bound to a single loop
+loop = asyncio.new_event_loop()
+run = loop.run_until_complete
+
 # Report data structure
 report = {
     "timestamp": datetime.now().isoformat(),
@@ -120,7 +126,7 @@ print()
 # Test 1: Server Status
 print("Test 1: Checking Horizon server status...")
 try:
-    status = utilities(action="status", horizon=horizon)
+    status = run(utilities(action="status", horizon=horizon))
     if "error" in status:
         add_test_result("Server Status", False, None, status["error"])
         exit(1)
@@ -133,7 +139,7 @@ except Exception as e:
 # Test 2: Create Account
 print("Test 2: Creating new account...")
 try:
-    result = account_manager(action="create", key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="create", key_manager=keys, horizon=horizon))
     if "error" in result:
         add_test_result("Create Account", False, None, result["error"])
         exit(1)
@@ -148,7 +154,7 @@ except Exception as e:
 # Test 3: List Accounts
 print("Test 3: Listing managed accounts...")
 try:
-    accounts = account_manager(action="list", key_manager=keys, horizon=horizon)
+    accounts = run(account_manager(action="list", key_manager=keys, horizon=horizon))
     if "error" in accounts:
         add_test_result("List Accounts", False, None, accounts["error"])
         exit(1)
@@ -162,7 +168,7 @@ except Exception as e:
 print("Test 4: Funding account via Friendbot...")
 print("   (This may take a few seconds...)")
 try:
-    result = account_manager(action="fund", account_id=account_id, key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="fund", account_id=account_id, key_manager=keys, horizon=horizon))
     if not result.get("success"):
         add_test_result("Fund Account", False, None, result.get("error"))
         exit(1)
@@ -174,15 +180,12 @@ except Exception as e:
 # Test 5: Get Account Details
 print("Test 5: Fetching account details...")
 try:
-    account = account_manager(action="get", account_id=account_id, key_manager=keys, horizon=horizon)
+    account = run(account_manager(action="get", account_id=account_id, key_manager=keys, horizon=horizon))
     if "error" in account:
         add_test_result("Get Account", False, None, account["error"])
         exit(1)
     else:
-        xlm_balance = None
-        for balance in account['balances']:
-            if balance['asset_type'] == 'native':
-                xlm_balance = balance['balance']
+        xlm_balance = account['balances_by_asset']['XLM']['balance']
         add_test_result("Get Account", True, f"Sequence: {account['sequence']}, XLM Balance: {xlm_balance}")
 except Exception as e:
     add_test_result("Get Account", False, None, str(e))
@@ -191,14 +194,14 @@ except Exception as e:
 # Test 6: Establish Trustline
 print("Test 6: Establishing trustline for USDC...")
 try:
-    result = trustline_manager(
+    result = run(trustline_manager(
         action="establish",
         account_id=account_id,
         asset_code="USDC",
         asset_issuer=USDC_ISSUER,
         key_manager=keys,
         horizon=horizon
-    )
+    ))
     if not result.get("success"):
         add_test_result("Establish Trustline", False, None, result.get("error"))
         exit(1)
@@ -210,12 +213,8 @@ except Exception as e:
 # Test 7: Verify Trustline
 print("Test 7: Verifying trustline in account...")
 try:
-    account = account_manager(action="get", account_id=account_id, key_manager=keys, horizon=horizon)
-    usdc_balance = None
-    for balance in account['balances']:
-        if balance.get('asset_code') == 'USDC':
-            usdc_balance = balance
-            break
+    account = run(account_manager(action="get", account_id=account_id, key_manager=keys, horizon=horizon))
+    usdc_balance = account['balances_by_asset'].get(f"USDC:{USDC_ISSUER}")
 
     if usdc_balance:
         add_test_result("Verify Trustline", True, f"USDC Balance: {usdc_balance['balance']}, Limit: {usdc_balance['limit']}")
@@ -227,7 +226,7 @@ except Exception as e:
 # Test 8: Get Transaction History
 print("Test 8: Fetching transaction history...")
 try:
-    result = account_manager(action="transactions", account_id=account_id, key_manager=keys, horizon=horizon, limit=5)
+    result = run(account_manager(action="transactions", account_id=account_id, key_manager=keys, horizon=horizon, limit=5))
     if "error" in result:
         add_test_result("Get Transactions", False, None, result["error"])
     else:
@@ -239,7 +238,7 @@ except Exception as e:
 # Test 9: Export Keypair
 print("Test 9: Exporting keypair...")
 try:
-    result = account_manager(action="export", account_id=account_id, key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="export", account_id=account_id, key_manager=keys, horizon=horizon))
     if "error" in result:
         add_test_result("Export Keypair", False, None, result["error"])
     else:
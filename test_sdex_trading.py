@@ -5,8 +5,9 @@ Showcases the 1-call market order feature (was 3 calls in v1)
 Generates detailed markdown report of results
 """
 
+import asyncio
 from datetime import datetime
-from stellar_sdk import Server
+import clients
 from key_manager import KeyManager
 from stellar_tools import (
     account_manager,
@@ -21,9 +22,14 @@ HORIZON_URL = "https://horizon-testnet.stellar.org"
 USDC_ISSUER = "GBBD47IF6LWK7P7MDEVSCWR7DPUWV3NY3DTQEVFL4NAT4AQH3ZLLFLA5"
 
 # Initialize
-horizon = Server(HORIZON_URL)
+horizon = clients.horizon(HORIZON_URL)
 keys = KeyManager()
 
+# Composite tools are async; drive them all on one event loop so the
+# Horizon client's connection pool stays bound to a single loop
+loop = asyncio.new_event_loop()
+run = loop.run_until_complete
+
 # Report data structure
 report = {
     "timestamp": datetime.now().isoformat(),
@@ -141,7 +147,7 @@ print()
 # Test 1: Create Account A (Buyer)
 print("Test 1: Creating Account A (Buyer)...")
 try:
-    result = account_manager(action="create", key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="create", key_manager=keys, horizon=horizon))
     if "error" in result:
         add_test_result("Create Account A", False, None, result["error"])
         exit(1)
@@ -156,7 +162,7 @@ except Exception as e:
 # Test 2: Create Account B (Seller)
 print("Test 2: Creating Account B (Seller)...")
 try:
-    result = account_manager(action="create", key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="create", key_manager=keys, horizon=horizon))
     if "error" in result:
         add_test_result("Create Account B", False, None, result["error"])
         exit(1)
@@ -172,7 +178,7 @@ except Exception as e:
 print("Test 3: Funding Account A...")
 print("   (This may take a few seconds...)")
 try:
-    result = account_manager(action="fund", account_id=account_a, key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="fund", account_id=account_a, key_manager=keys, horizon=horizon))
     if not result.get("success"):
         add_test_result("Fund Account A", False, None, result.get("error"))
         exit(1)
@@ -185,7 +191,7 @@ except Exception as e:
 print("Test 4: Funding Account B...")
 print("   (This may take a few seconds...)")
 try:
-    result = account_manager(action="fund", account_id=account_b, key_manager=keys, horizon=horizon)
+    result = run(account_manager(action="fund", account_id=account_b, key_manager=keys, horizon=horizon))
     if not result.get("success"):
         add_test_result("Fund Account B", False, None, result.get("error"))
         exit(1)
@@ -197,14 +203,14 @@ except Exception as e:
 # Test 5: Establish USDC trustline on Account A
 print("Test 5: Establishing USDC trustline on Account A...")
 try:
-    result = trustline_manager(
+    result = run(trustline_manager(
         action="establish",
         account_id=account_a,
         asset_code="USDC",
         asset_issuer=USDC_ISSUER,
         key_manager=keys,
         horizon=horizon
-    )
+    ))
     if not result.get("success"):
         add_test_result("Establish Trustline A", False, None, result.get("error"))
         exit(1)
@@ -216,14 +222,14 @@ except Exception as e:
 # Test 6: Establish USDC trustline on Account B
 print("Test 6: Establishing USDC trustline on Account B...")
 try:
-    result = trustline_manager(
+    result = run(trustline_manager(
         action="establish",
         account_id=account_b,
         asset_code="USDC",
         asset_issuer=USDC_ISSUER,
         key_manager=keys,
         horizon=horizon
-    )
+    ))
     if not result.get("success"):
         add_test_result("Establish Trustline B", False, None, result.get("error"))
         exit(1)
@@ -235,14 +241,14 @@ except Exception as e:
 # Test 7: Query USDC/XLM Orderbook
 print("Test 7: Querying USDC/XLM orderbook...")
 try:
-    result = market_data(
+    result = run(market_data(
         action="orderbook",
         horizon=horizon,
         base_asset="XLM",
         quote_asset="USDC",
         quote_issuer=USDC_ISSUER,
         limit=10
-    )
+    ))
     if "error" in result:
         add_test_result("Query Orderbook", False, None, result["error"])
     else:
@@ -256,7 +262,7 @@ except Exception as e:
 print("Test 8: Placing limit buy order (Account A: Buy 10 USDC at 0.50 XLM/USDC)...")
 print("   (v2 composite tool - 1 call instead of 3)")
 try:
-    result = trading(
+    result = run(trading(
         action="buy",
         order_type="limit",
         account_id=account_a,
@@ -268,7 +274,7 @@ try:
         amount="10",
         price="0.50",
         auto_sign=True
-    )
+    ))
     if not result.get("success"):
         add_test_result("Place Limit Buy Order", False, None, result.get("error"))
     else:
@@ -284,7 +290,7 @@ except Exception as e:
 print("Test 9: Placing limit buy order (Account B: Buy 200 USDC with 100 XLM at 0.5 XLM/USDC)...")
 print("   (v2 composite tool - 1 call instead of 3)")
 try:
-    result = trading(
+    result = run(trading(
         action="buy",
         order_type="limit",
         account_id=account_b,
@@ -296,7 +302,7 @@ try:
         amount="200",
         price="0.5",
         auto_sign=True
-    )
+    ))
     if not result.get("success"):
         add_test_result("Place Limit Buy Order", False, None, result.get("error"))
     else:
@@ -311,7 +317,7 @@ except Exception as e:
 # Test 10: Check Open Orders for Account A
 print("Test 10: Checking open orders for Account A...")
 try:
-    result = trading(action="get_orders", account_id=account_a, key_manager=keys, horizon=horizon)
+    result = run(trading(action="get_orders", account_id=account_a, key_manager=keys, horizon=horizon))
     if "error" in result:
         add_test_result("Check Open Orders A", False, None, result["error"])
     else:
@@ -327,7 +333,7 @@ except Exception as e:
 # Test 11: Check Open Orders for Account B
 print("Test 11: Checking open orders for Account B...")
 try:
-    result = trading(action="get_orders", account_id=account_b, key_manager=keys, horizon=horizon)
+    result = run(trading(action="get_orders", account_id=account_b, key_manager=keys, horizon=horizon))
     if "error" in result:
         add_test_result("Check Open Orders B", False, None, result["error"])
     else:
@@ -344,14 +350,14 @@ except Exception as e:
 print("Test 12: Canceling order from Account A...")
 if "offer_id_a" in report:
     try:
-        result = trading(
+        result = run(trading(
             action="cancel_order",
             account_id=account_a,
             offer_id=str(report["offer_id_a"]),
             key_manager=keys,
             horizon=horizon,
             auto_sign=True
-        )
+        ))
         if not result.get("success"):
             add_test_result("Cancel Order A", False, None, result.get("error"))
         else:
@@ -369,14 +375,14 @@ else:
 print("Test 13: Canceling order from Account B...")
 if "offer_id_b" in report:
     try:
-        result = trading(
+        result = run(trading(
             action="cancel_order",
             account_id=account_b,
             offer_id=str(report["offer_id_b"]),
             key_manager=keys,
             horizon=horizon,
             auto_sign=True
-        )
+        ))
         if not result.get("success"):
             add_test_result("Cancel Order B", False, None, result.get("error"))
         else:
@@ -393,8 +399,8 @@ else:
 # Test 14: Verify Orders Cancelled
 print("Test 14: Verifying orders cancelled...")
 try:
-    result_a = trading(action="get_orders", account_id=account_a, key_manager=keys, horizon=horizon)
-    result_b = trading(action="get_orders", account_id=account_b, key_manager=keys, horizon=horizon)
+    result_a = run(trading(action="get_orders", account_id=account_a, key_manager=keys, horizon=horizon))
+    result_b = run(trading(action="get_orders", account_id=account_b, key_manager=keys, horizon=horizon))
 
     orders_a = len(result_a.get("offers", []))
     orders_b = len(result_b.get("offers", []))
@@ -417,14 +423,14 @@ print("   (Using Account A, will pay market price in testnet XLM)")
 print("   (v2 composite tool - 1 call vs v1 3 separate calls)")
 try:
     # Query current orderbook to find best ask
-    orderbook = market_data(
+    orderbook = run(market_data(
         action="orderbook",
         horizon=horizon,
         base_asset="XLM",
         quote_asset="USDC",
         quote_issuer=USDC_ISSUER,
         limit=10
-    )
+    ))
 
     # To BUY USDC (sell XLM), we look at bids (people buying XLM with USDC)
     if orderbook.get("bids") and len(orderbook["bids"]) > 0:
@@ -441,7 +447,7 @@ try:
         print(f"   Placing market buy: {buy_amount} USDC (will cost ~{buy_amount * price_xlm_per_usdc:.2f} XLM)")
 
         # v2 SINGLE CALL with auto-signing (vs v1: 3 separate calls)
-        result = trading(
+        result = run(trading(
             action="buy",
             order_type="market",
             account_id=account_a,
@@ -452,7 +458,7 @@ try:
             buying_issuer=USDC_ISSUER,
             amount=str(buy_amount),
             auto_sign=True
-        )
+        ))
 
         if not result.get("success"):
             add_test_result("Market Buy USDC", False, None, result.get("error"))
@@ -461,15 +467,11 @@ try:
             import time
             time.sleep(3)
 
-            account_details = account_manager(action="get", account_id=account_a, key_manager=keys, horizon=horizon)
-            usdc_balance = None
-            xlm_balance = None
-
-            for bal in account_details["balances"]:
-                if bal["asset_type"] == "native":
-                    xlm_balance = bal["balance"]
-                elif bal.get("asset_code") == "USDC":
-                    usdc_balance = float(bal["balance"])
+            account_details = run(account_manager(action="get", account_id=account_a, key_manager=keys, horizon=horizon))
+            balances = account_details["balances_by_asset"]
+            xlm_balance = balances["XLM"]["balance"]
+            usdc = balances.get(f"USDC:{USDC_ISSUER}")
+            usdc_balance = float(usdc["balance"]) if usdc else None
 
             if usdc_balance and usdc_balance > 0:
                 add_test_result(
@@ -8,7 +8,7 @@ import asyncio
 import os
 from datetime import datetime
 from stellar_sdk import Network
-from stellar_ssl import create_soroban_client_with_ssl
+import clients
 from stellar_soroban import soroban_operations
 from key_manager import KeyManager
 
@@ -125,7 +125,7 @@ async def test_soroban_integration():
     # To test with a real contract, deploy one and update CONTRACT_ID.
     CONTRACT_ID = None  # Set to a valid contract ID if available
 
-    soroban = create_soroban_client_with_ssl(SOROBAN_RPC_URL)
+    soroban = clients.soroban(SOROBAN_RPC_URL)
     keys = KeyManager()
 
     print("🧪 Testing Soroban operations...")